@@ -0,0 +1,6 @@
+"""Cyberfly MicroPython SDK."""
+
+from .data_shipper import CyberflyDataShipper
+from .sensors import SensorManager
+from . import shipper_utils
+from . import time_utils
@@ -0,0 +1,116 @@
+"""MQTT data shipper: drives sensors and pushes readings to cyberfly."""
+
+import time
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+try:
+    from umqtt.robust import MQTTClient
+except ImportError:
+    MQTTClient = None
+
+from . import shipper_utils
+from .sensors import SensorManager
+from .shipper_utils import _DEBUG
+from .time_utils import get_time
+
+
+class CyberflyDataShipper:
+    """Device-side client: one MQTT session plus a sensor registry.
+
+    Inbound messages on the device topic are parsed as command dicts,
+    handed to the user callback registered via on_message(), and then
+    dispatched to the SensorManager.
+    """
+
+    def __init__(self, device_id, key_pair, ssid=None, password=None,
+                 broker="node.cyberfly.io", port=1883):
+        self.device_id = device_id
+        self.key_pair = key_pair
+        self.topic = device_id
+        self.manager = SensorManager()
+        self.on_received = None
+        if ssid is not None:
+            shipper_utils.connect_wifi(ssid, password)
+        self.client = None
+        if MQTTClient is not None:
+            self.client = MQTTClient(device_id, broker, port=port,
+                                     keepalive=60)
+            self.client.set_callback(self._callback)
+            try:
+                self.client.connect()
+                self.client.subscribe(self.topic)
+            except Exception as e:
+                print("mqtt connect failed: {}".format(e))
+
+    def on_message(self):
+        """Decorator registering a handler for inbound command dicts."""
+        def decorator(fn):
+            self.on_received = fn
+            return fn
+        return decorator
+
+    def _callback(self, topic, msg):
+        try:
+            data = json.loads(msg)
+        except ValueError:
+            print("invalid json on", topic)
+            return
+        if self.on_received is not None:
+            try:
+                self.on_received(data)
+            except Exception as e:
+                print("on_message handler failed: {}".format(e))
+        # Only dicts carrying an action are commands. The device's own
+        # published readings arrive back on this same topic; dispatching
+        # them would publish an error response, which would echo in turn
+        # - an unbounded feedback loop.
+        if not isinstance(data, dict) or "action" not in data:
+            return
+        try:
+            result = self.manager.process_command(data)
+            if result is not None and self.client is not None:
+                self.publish_data(result)
+        except Exception as e:
+            print("command failed: {}".format(e))
+
+    def check_msg(self):
+        """Pump one pending MQTT message, if any."""
+        if self.client is not None:
+            try:
+                self.client.check_msg()
+            except Exception as e:
+                print("mqtt check failed: {}".format(e))
+
+    def publish_data(self, data):
+        if self.client is None:
+            return
+        shipper_utils.publish(self.client, data, [self.topic],
+                              self.key_pair)
+
+    def sensor_monitoring_loop(self, interval=30, run_for=None):
+        """Read all sensors every interval seconds and publish readings."""
+        interval_ms = int(interval * 1000)
+        started = time.ticks_ms()
+        next_at = started
+        run_for_ms = None if run_for is None else int(run_for * 1000)
+        while True:
+            now = time.ticks_ms()
+            if (run_for_ms is not None
+                    and time.ticks_diff(now, started) >= run_for_ms):
+                break
+            if time.ticks_diff(now, next_at) >= 0:
+                readings = self.manager.read_all()
+                if _DEBUG:
+                    print("publishing {} readings".format(len(readings)))
+                self.publish_data({
+                    "device_id": self.device_id,
+                    "readings": readings,
+                    "time": get_time(),
+                })
+                next_at = time.ticks_add(now, interval_ms)
+            self.check_msg()
+            time.sleep(0.1)
@@ -0,0 +1,145 @@
+"""Ed25519 signing and Pact hashing for command payloads.
+
+Pure-Python reference implementation: slow but dependency-free, so it
+runs on any port. Keys are the 32-byte hex seed/verifying key pair the
+cyberfly dashboard issues per device.
+"""
+
+import hashlib
+
+try:
+    import ubinascii as binascii
+except ImportError:
+    import binascii
+
+# Curve parameters for edwards25519 (RFC 8032).
+_q = 2 ** 255 - 19
+_l = 2 ** 252 + 27742317777372353535851937790883648493
+
+
+def _inv(x):
+    return pow(x, _q - 2, _q)
+
+
+_d = -121665 * _inv(121666) % _q
+_I = pow(2, (_q - 1) // 4, _q)
+
+
+def _xrecover(y):
+    xx = (y * y - 1) * _inv(_d * y * y + 1)
+    x = pow(xx, (_q + 3) // 8, _q)
+    if (x * x - xx) % _q != 0:
+        x = (x * _I) % _q
+    if x % 2 != 0:
+        x = _q - x
+    return x
+
+
+_By = 4 * _inv(5) % _q
+_B = (_xrecover(_By), _By)
+
+
+def _edwards(P, Q):
+    x1, y1 = P
+    x2, y2 = Q
+    den = _d * x1 * x2 * y1 * y2
+    x3 = (x1 * y2 + x2 * y1) * _inv(1 + den)
+    y3 = (y1 * y2 + x1 * x2) * _inv(1 - den)
+    return (x3 % _q, y3 % _q)
+
+
+def _scalarmult(P, e):
+    # Iterative double-and-add; recursion would blow MicroPython's much
+    # smaller default stack at 253 levels deep.
+    Q = (0, 1)
+    while e:
+        if e & 1:
+            Q = _edwards(Q, P)
+        P = _edwards(P, P)
+        e >>= 1
+    return Q
+
+
+def _encodepoint(P):
+    x, y = P
+    return (y | ((x & 1) << 255)).to_bytes(32, 'little')
+
+
+def _clamp(h):
+    a = int.from_bytes(h[:32], 'little')
+    a &= (1 << 254) - 8
+    a |= 1 << 254
+    return a
+
+
+def public_key(seed):
+    """Derive the 32-byte verifying key from a 32-byte seed."""
+    return _encodepoint(_scalarmult(_B, _clamp(hashlib.sha512(seed).digest())))
+
+
+# Optional native Ed25519: the ucrypto C module signs in microseconds
+# where the pure-Python ladder below takes on the order of a second, so
+# prefer it whenever the firmware ships it.
+try:
+    from ucrypto import ed25519_sign as _native_sign
+except ImportError:
+    _native_sign = None
+
+
+def sign(msg, seed, pub=None):
+    """RFC 8032 Ed25519 signature of msg (bytes) with a 32-byte seed."""
+    if _native_sign is not None:
+        try:
+            return _native_sign(seed, msg)
+        except Exception:
+            pass
+    if pub is None:
+        pub = public_key(seed)
+    h = hashlib.sha512(seed).digest()
+    a = _clamp(h)
+    r = int.from_bytes(hashlib.sha512(h[32:] + msg).digest(), 'little') % _l
+    R = _encodepoint(_scalarmult(_B, r))
+    k = int.from_bytes(hashlib.sha512(R + pub + msg).digest(), 'little') % _l
+    s = (r + k * a) % _l
+    return R + s.to_bytes(32, 'little')
+
+
+def _b64url(data):
+    s = binascii.b2a_base64(data).rstrip(b'\n').decode()
+    return s.replace('+', '-').replace('/', '_').rstrip('=')
+
+
+def _pact_digest(msg):
+    """blake2b-256 digest of a command; the bytes Pact hashes and signs.
+
+    Ports whose hashlib lacks blake2b fall back to sha256; the node
+    rejects such hashes, so those builds should ship a blake2b module.
+    """
+    if isinstance(msg, str):
+        msg = msg.encode()
+    try:
+        return hashlib.blake2b(msg, digest_size=32).digest()
+    except AttributeError:
+        return hashlib.sha256(msg).digest()
+
+
+def pact_hash(msg):
+    """Pact command hash: base64url of the blake2b-256 digest."""
+    return _b64url(_pact_digest(msg))
+
+
+class Crypto:
+    """Signs Pact command payloads with a device key pair."""
+
+    def sign(self, msg, key_pair):
+        seed = binascii.unhexlify(key_pair["secretKey"])
+        pub = binascii.unhexlify(key_pair["publicKey"])
+        # Pact signers sign the 32-byte command digest - the same bytes
+        # base64url'd into the hash field - and nodes verify the sig
+        # against that hash, not against the raw JSON.
+        digest = _pact_digest(msg)
+        return {
+            "hash": _b64url(digest),
+            "sig": binascii.hexlify(sign(digest, seed, pub)).decode(),
+            "pubKey": key_pair["publicKey"],
+        }
@@ -0,0 +1,23 @@
+"""Pact expression builders."""
+
+
+def mk_exp(function, *args):
+    """Render a Pact s-expression, quoting string arguments."""
+    parts = []
+    for arg in args:
+        if isinstance(arg, str):
+            parts.append('"%s"' % arg)
+        elif isinstance(arg, bool):
+            parts.append("true" if arg else "false")
+        else:
+            parts.append(str(arg))
+    return "(%s %s)" % (function, " ".join(parts))
+
+
+def mk_cap(role, description, name, args=None):
+    """Build a capability object for a signer list."""
+    return {
+        "role": role,
+        "description": description,
+        "cap": {"name": name, "args": args if args is not None else []},
+    }
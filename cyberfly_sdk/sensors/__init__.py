@@ -0,0 +1,133 @@
+"""Sensor framework for the cyberfly SDK.
+
+Sensors are registered with a :class:`SensorManager` and driven through
+``process_command`` dicts received over MQTT.
+"""
+
+import time
+
+from .base import (BaseSensor, I2CBaseSensor, SensorReading, asyncio,
+                   native)
+from . import basic_sensors
+from . import environmental_sensors
+from . import gpio_sensors
+from . import i2c_sensors
+from . import display_sensors
+
+_SENSOR_CLASSES = {
+    "digital_in": basic_sensors.DigitalInputSensor,
+    "analog_in": basic_sensors.AnalogInputSensor,
+    "internal_temp": basic_sensors.InternalTempSensor,
+    "system_info": basic_sensors.SystemInfoSensor,
+    "dht11": environmental_sensors.DHT11Sensor,
+    "dht22": environmental_sensors.DHT22Sensor,
+    "bmp280": environmental_sensors.BMP280Sensor,
+    "bme280": environmental_sensors.BME280Sensor,
+    "bme680": environmental_sensors.BME680Sensor,
+    "ds18b20": gpio_sensors.DS18B20Sensor,
+    "ultrasonic": gpio_sensors.UltrasonicSensor,
+    "hcsr04": gpio_sensors.HC_SR04Sensor,
+    "pir": gpio_sensors.PIRSensor,
+    "bh1750": i2c_sensors.BH1750Sensor,
+    "ccs811": i2c_sensors.CCS811Sensor,
+    "tsl2561": i2c_sensors.TSL2561Sensor,
+    "apds9960": i2c_sensors.APDS9960Sensor,
+    "vl53l0x": i2c_sensors.VL53L0XSensor,
+    "ads1115": i2c_sensors.ADS1115Sensor,
+    "sht31d": i2c_sensors.SHT31DSensor,
+    "tcs34725": i2c_sensors.TCS34725Sensor,
+    "mpu6050": i2c_sensors.MPU6050Sensor,
+    "lcd1602": display_sensors.LCD1602Sensor,
+    "ht16k33": display_sensors.HT16K33Sensor,
+}
+
+
+class SensorManager:
+    """Registry of configured sensors plus a small command dispatcher."""
+
+    def __init__(self):
+        self.sensors = {}
+
+    def add_sensor(self, sensor_id, sensor_type, inputs=None):
+        cls = _SENSOR_CLASSES.get(sensor_type)
+        if cls is None:
+            raise ValueError("unknown sensor type: {}".format(sensor_type))
+        sensor = cls(sensor_id, sensor_type, inputs)
+        self.sensors[sensor_id] = sensor
+        return sensor
+
+    def remove_sensor(self, sensor_id):
+        return self.sensors.pop(sensor_id, None) is not None
+
+    def get_sensor(self, sensor_id):
+        return self.sensors.get(sensor_id)
+
+    def read_all(self):
+        readings = []
+        for sensor_id in self.sensors:
+            readings.append(self._read_one(sensor_id))
+        return readings
+
+    async def read_all_async(self):
+        """Read every sensor concurrently.
+
+        Drivers that override read_async() yield during their wait states
+        (DS18B20 conversion, ultrasonic echo), so the slowest sensor bounds
+        the whole poll instead of the sum of all waits.
+        """
+        ids = list(self.sensors)
+        results = await asyncio.gather(
+            *[self._read_one_async(sensor_id) for sensor_id in ids])
+        return list(results)
+
+    async def _read_one_async(self, sensor_id):
+        sensor = self.sensors.get(sensor_id)
+        if sensor is None:
+            return SensorReading(sensor_id, "unknown", status="error",
+                                 error="sensor not found").to_dict()
+        try:
+            data = await sensor.read_async()
+            return SensorReading(sensor_id, sensor.sensor_type, data).to_dict()
+        except Exception as e:
+            return SensorReading(sensor_id, sensor.sensor_type, status="error",
+                                 error=str(e)).to_dict()
+
+    def read_sensor(self, sensor_id):
+        """Read one sensor without building a command dict.
+
+        Fast path for local callers (the monitoring loop); MQTT commands
+        still go through process_command.
+        """
+        return self._read_one(sensor_id)
+
+    def _read_one(self, sensor_id):
+        sensor = self.sensors.get(sensor_id)
+        if sensor is None:
+            return SensorReading(sensor_id, "unknown", status="error",
+                                 error="sensor not found").to_dict()
+        try:
+            data = sensor.read()
+            return SensorReading(sensor_id, sensor.sensor_type, data).to_dict()
+        except Exception as e:
+            return SensorReading(sensor_id, sensor.sensor_type, status="error",
+                                 error=str(e)).to_dict()
+
+    @native
+    def process_command(self, command):
+        action = command.get("action")
+        if action == "read":
+            return self._read_one(command.get("sensor_id"))
+        if action == "read_all":
+            return {"readings": self.read_all(), "timestamp": time.time()}
+        if action == "list":
+            return {"sensors": [
+                {"sensor_id": s.sensor_id, "sensor_type": s.sensor_type}
+                for s in self.sensors.values()
+            ]}
+        if action == "add":
+            self.add_sensor(command.get("sensor_id"), command.get("sensor_type"),
+                            command.get("inputs"))
+            return {"success": True}
+        if action == "remove":
+            return {"success": self.remove_sensor(command.get("sensor_id"))}
+        return {"success": False, "error": "unknown action: {}".format(action)}
@@ -0,0 +1,200 @@
+"""Base classes shared by the cyberfly sensor drivers."""
+
+import struct
+import time
+
+from machine import I2C, Pin, SoftI2C
+
+try:
+    # Emit native machine code for decorated hot paths on MicroPython.
+    from micropython import native
+except ImportError:
+    def native(f):
+        return f
+
+try:
+    import uasyncio as asyncio
+except ImportError:
+    import asyncio
+
+
+def _sleep_ms(ms):
+    # uasyncio has sleep_ms; plain asyncio only sleep(seconds).
+    sleep_ms = getattr(asyncio, "sleep_ms", None)
+    if sleep_ms is not None:
+        return sleep_ms(ms)
+    return asyncio.sleep(ms / 1000)
+
+
+class SensorReading:
+    """Container for a single sensor reading.
+
+    __slots__ avoids a per-instance __dict__; one of these is built per
+    sensor per poll, so the saving compounds over a long-running loop.
+    """
+
+    __slots__ = ('sensor_id', 'sensor_type', 'data', 'timestamp',
+                 'status', 'error')
+
+    def __init__(self, sensor_id, sensor_type, data=None, timestamp=None,
+                 status="ok", error=None):
+        # Callers pass str ids/types and dict data already; coercing them
+        # here just allocated fresh objects per reading.
+        self.sensor_id = sensor_id
+        self.sensor_type = sensor_type
+        self.data = data if data is not None else {}
+        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.status = status
+        self.error = error
+
+    def to_dict(self):
+        return {
+            "sensor_id": self.sensor_id,
+            "sensor_type": self.sensor_type,
+            "data": self.data,
+            "timestamp": self.timestamp,
+            "status": self.status,
+            "error": self.error,
+        }
+
+
+class BaseSensor:
+    """Common behaviour for all sensors: identity, inputs and read caching."""
+
+    def __init__(self, sensor_id, sensor_type, inputs=None):
+        self.sensor_id = sensor_id
+        self.sensor_type = sensor_type
+        self.inputs = inputs if inputs is not None else {}
+        self.last_reading = None
+        self.last_read_time = 0
+        # Bound-method alias: call sites use self._cache(...) which is a
+        # plain attribute load instead of a method lookup per read.
+        self._cache = self._cache_reading
+
+    def _cache_reading(self, data, cache_time=1000):
+        # cache_time is in milliseconds. ticks_ms is integer-only (no boxed
+        # float per call) and monotonic, so an NTP step can't wedge or
+        # bypass the cache the way wall-clock time could.
+        now = time.ticks_ms()
+        if (self.last_reading is not None
+                and time.ticks_diff(now, self.last_read_time) < cache_time):
+            return self.last_reading
+        self.last_reading = data
+        self.last_read_time = now
+        return data
+
+    def _get_cached(self, cache_time=1000):
+        """Return the cached reading if younger than cache_time ms, else None.
+
+        Split from _cache_reading so drivers whose measurement itself is
+        expensive (trigger pulses, conversions) can test the cache before
+        touching the hardware at all.
+        """
+        if (self.last_reading is not None
+                and time.ticks_diff(time.ticks_ms(),
+                                    self.last_read_time) < cache_time):
+            return self.last_reading
+        return None
+
+    def _store_cached(self, data):
+        self.last_reading = data
+        self.last_read_time = time.ticks_ms()
+        return data
+
+    def read(self):
+        raise NotImplementedError("read() must be implemented by sensor driver")
+
+    async def read_async(self):
+        """Async read; drivers with real wait states override this to yield
+        to the scheduler instead of blocking."""
+        return self.read()
+
+
+# Shared bus objects keyed by (bus, scl, sda, freq) with their scan
+# results in a parallel dict. Instantiating several sensors on one bus
+# reuses a single handle and a single 128-address scan instead of
+# repeating both per sensor; the scan cache lives only until
+# refresh_i2c_scan() is called for hot-plugged devices.
+_I2C_BUSES = {}
+_I2C_SCAN = {}
+
+
+def _get_present_devices(key):
+    """Scan the bus lazily, once, and cache the result as a frozenset.
+
+    Deferring the scan to the first address check keeps bus construction
+    instant, and a frozenset makes the membership probe O(1).
+    """
+    devices = _I2C_SCAN.get(key)
+    if devices is None:
+        devices = frozenset(_I2C_BUSES[key].scan())
+        _I2C_SCAN[key] = devices
+    return devices
+
+
+def refresh_i2c_scan():
+    """Re-scan every open I2C bus and refresh the cached device lists."""
+    for key, i2c in _I2C_BUSES.items():
+        _I2C_SCAN[key] = frozenset(i2c.scan())
+
+
+class I2CBaseSensor(BaseSensor):
+    """Base for sensors attached to an I2C bus.
+
+    Runs the bus at 400 kHz fast-mode by default; pass inputs['freq']
+    (e.g. 100000) for parts that need standard-mode or that clock-stretch
+    badly at higher rates.
+    """
+
+    def __init__(self, sensor_id, sensor_type, inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.address = self.inputs.get("address")
+        i2c_bus = self.inputs.get("i2c_bus", 0)
+        freq = self.inputs.get("freq", 400000)
+        scl = self.inputs.get("scl", 22 if i2c_bus == 0 else 25)
+        sda = self.inputs.get("sda", 21 if i2c_bus == 0 else 26)
+        key = (i2c_bus, scl, sda, freq)
+        i2c = _I2C_BUSES.get(key)
+        if i2c is None:
+            i2c = self._open_bus(i2c_bus, scl, sda, freq)
+            _I2C_BUSES[key] = i2c
+        self.i2c = i2c
+        self._bus_key = key
+        # Shared register-block buffer for read_block(); sized for the
+        # largest contiguous block the drivers here burst-read.
+        self._buf = bytearray(16)
+        self._mv = memoryview(self._buf)
+        if self.address is not None and self.address not in _get_present_devices(key):
+            print("I2C device 0x%02x not found on bus %d" % (self.address, i2c_bus))
+
+    def read_block(self, reg, n):
+        """Burst-read n contiguous registers into the shared buffer.
+
+        One I2C transaction, no allocation: returns a memoryview over the
+        preallocated buffer that callers can struct.unpack directly.
+        """
+        mv = self._mv[:n]
+        self.i2c.readfrom_mem_into(self.address, reg, mv)
+        return mv
+
+    @staticmethod
+    def _open_bus(i2c_bus, scl, sda, freq):
+        # Prefer the hardware peripheral, which actually achieves the
+        # programmed rate; fall back to bit-banged SoftI2C on boards
+        # without a hardware controller for this bus.
+        try:
+            i2c = I2C(i2c_bus, scl=Pin(scl), sda=Pin(sda), freq=freq)
+        except (ValueError, OSError):
+            i2c = SoftI2C(scl=Pin(scl), sda=Pin(sda), freq=freq)
+        return i2c
+
+    @staticmethod
+    def _bytes_to_int(msb, lsb, signed=False):
+        # struct handles the two's-complement fixup in C.
+        return struct.unpack('>h' if signed else '>H', bytes((msb, lsb)))[0]
+
+    @staticmethod
+    def _bytes_to_ints(buf, fmt):
+        """Unpack a whole register block in one C-level call, e.g.
+        _bytes_to_ints(block, '>hhhhhhh') for a 14-byte MPU6050 burst."""
+        return struct.unpack(fmt, buf)
@@ -0,0 +1,197 @@
+"""Board-level sensors: raw GPIO/ADC inputs, die temperature and system info."""
+
+import gc
+import time
+
+import machine
+from machine import ADC, Pin
+
+from .base import BaseSensor
+
+# Module-level bindings: a module-global load is one dict probe versus
+# the two (module + attribute) paid by gc.mem_free etc. in the read path.
+_gc_collect = gc.collect
+_mem_free = gc.mem_free
+_mem_alloc = gc.mem_alloc
+_ticks_ms = time.ticks_ms
+_ticks_diff = time.ticks_diff
+
+
+def _round1(value):
+    # Integer-scaled rounding; cheaper than round() on ports where it is
+    # a Python-level function, and allocates one float instead of two.
+    return int(value * 10 + (0.5 if value >= 0 else -0.5)) / 10.0
+
+
+def _round3(value):
+    return int(value * 1000 + (0.5 if value >= 0 else -0.5)) / 1000.0
+
+
+_temp_platform = None
+
+
+def _detect_internal_temp_platform():
+    """Probe the port for a die-temperature source, memoized: the answer
+    cannot change after boot, so the import attempts run once per boot
+    no matter how many sensors are constructed."""
+    global _temp_platform
+    if _temp_platform is None:
+        try:
+            import esp32  # noqa: F401
+            _temp_platform = "esp32"
+        except ImportError:
+            try:
+                import rp2  # noqa: F401
+                _temp_platform = "rp2"
+            except ImportError:
+                _temp_platform = "unknown"
+    return _temp_platform
+
+
+class DigitalInputSensor(BaseSensor):
+    """Plain digital input pin reported as state/value.
+
+    read() returns one of two shared constant dicts (a pin has exactly
+    two states), so polling allocates nothing. Consumers must treat the
+    result as read-only and copy before mutating.
+    """
+
+    _STATE_HIGH = {"value": 1, "state": "high"}
+    _STATE_LOW = {"value": 0, "state": "low"}
+
+    def __init__(self, sensor_id, sensor_type="digital_in", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        pin_no = self.inputs.get("pin_no", 0)
+        pull = self.inputs.get("pull")
+        if pull == "up":
+            self.pin = Pin(pin_no, Pin.IN, Pin.PULL_UP)
+        elif pull == "down":
+            self.pin = Pin(pin_no, Pin.IN, Pin.PULL_DOWN)
+        else:
+            self.pin = Pin(pin_no, Pin.IN)
+        # Bound-method alias: one attribute load instead of two per poll.
+        self._pin_value = self.pin.value
+
+    def read(self):
+        # No try/except: Pin.value() does not raise on a pin that
+        # constructed successfully, and the handler setup costs on every
+        # poll of what is the hottest read path in this module.
+        data = self._STATE_HIGH if self._pin_value() else self._STATE_LOW
+        return self._cache(data, cache_time=50)
+
+
+class AnalogInputSensor(BaseSensor):
+    """ADC input pin reported as raw count, voltage and percent."""
+
+    def __init__(self, sensor_id, sensor_type="analog_in", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        pin_no = self.inputs.get("pin_no", 34)
+        self.adc = ADC(Pin(pin_no))
+        try:
+            self.adc.atten(ADC.ATTN_11DB)
+        except AttributeError:
+            pass
+        self.vref = self.inputs.get("vref", 3.3)
+        # Per-sample work is one multiply per output; the divisions are
+        # folded into these constants once.
+        self._v_scale = self.vref / 65535.0
+        self._pct_scale = 100.0 / 65535.0
+
+    def read(self):
+        # Hardware errors propagate with their real traceback; the manager
+        # turns them into error readings at the dispatch level.
+        raw = self.adc.read_u16()
+        data = {
+            "raw": raw,
+            "voltage": _round3(raw * self._v_scale),
+            "percent": _round1(raw * self._pct_scale),
+        }
+        return self._cache(data, cache_time=100)
+
+
+class InternalTempSensor(BaseSensor):
+    """MCU die temperature, where the port exposes one."""
+
+    def __init__(self, sensor_id, sensor_type="internal_temp", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        # rp2 conversion constants, folded once (see AnalogInputSensor).
+        self._v_scale = 3.3 / 65535.0
+        self._temp_k = 1.0 / 0.001721
+        # Ports without a die sensor can inject a source (e.g. for tests)
+        # instead of the driver fabricating values.
+        self._temp_fn = self.inputs.get("temp_fn")
+        # The platform never changes after boot, so pick the reader once
+        # and bind it over read(): no per-poll platform string compares.
+        platform = _detect_internal_temp_platform()
+        if platform == "esp32":
+            self.read = self._read_esp32
+        elif platform == "rp2":
+            self.read = self._read_rp2
+        else:
+            self.read = self._read_generic
+
+    def _read_esp32(self):
+        import esp32
+        temp_c = (esp32.raw_temperature() - 32) / 1.8
+        return self._cache({"temperature": _round1(temp_c)}, cache_time=1000)
+
+    def _read_rp2(self):
+        voltage = ADC(4).read_u16() * self._v_scale
+        temp_c = 27 - (voltage - 0.706) * self._temp_k
+        return self._cache({"temperature": _round1(temp_c)}, cache_time=1000)
+
+    def _read_generic(self):
+        if self._temp_fn is None:
+            raise OSError("no internal temperature source")
+        return self._cache({"temperature": _round1(self._temp_fn())},
+                           cache_time=1000)
+
+
+class SystemInfoSensor(BaseSensor):
+    """Heap and uptime statistics.
+
+    gc.mem_free()/gc.mem_alloc() walk every heap block (milliseconds on
+    larger heaps), so readings are refreshed at most once per TTL window.
+    Reads never collect as a side effect — the figures describe current
+    memory, not post-collect memory; call force_gc() when a collection
+    is actually wanted, or set inputs['collect_before_read'] to restore
+    the old behaviour.
+    """
+
+    def __init__(self, sensor_id, sensor_type="system_info", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        self._info_ttl_ms = int(self.inputs.get("ttl", 5) * 1000)
+        self._collect_before_read = self.inputs.get("collect_before_read", False)
+        # Reused result dict, mutated in place per refresh; consumers must
+        # copy if they retain readings across polls.
+        self._result = {
+            "mem_free": 0,
+            "mem_alloc": 0,
+            "mem_percent": 0.0,
+            "freq": 0,
+            "uptime_s": 0,
+        }
+
+    def read(self):
+        if (self.last_reading is not None
+                and _ticks_diff(_ticks_ms(), self.last_read_time) < self._info_ttl_ms):
+            return self.last_reading
+        if self._collect_before_read:
+            _gc_collect()
+        mem_free = _mem_free()
+        mem_alloc = _mem_alloc()
+        mem_total = mem_free + mem_alloc
+        # Integer tenths-of-a-percent, one float at the end: cheaper
+        # than float divide + multiply + round on soft-float ports.
+        result = self._result
+        result["mem_free"] = mem_free
+        result["mem_alloc"] = mem_alloc
+        result["mem_percent"] = ((mem_alloc * 1000) // max(mem_total, 1)) / 10.0
+        result["freq"] = machine.freq()
+        result["uptime_s"] = _ticks_ms() // 1000
+        return self._cache(result, cache_time=self._info_ttl_ms)
+
+    def force_gc(self):
+        """Collect now and invalidate the cached reading."""
+        _gc_collect()
+        self.last_reading = None
@@ -0,0 +1,102 @@
+"""Display drivers exposed through the sensor interface.
+
+Displays are write-mostly devices; read() reports driver status so the
+manager can poll them uniformly. Result dicts are preallocated and
+mutated in place to keep the polling loop allocation-free.
+"""
+
+import time
+
+from .base import I2CBaseSensor
+
+
+class LCD1602Sensor(I2CBaseSensor):
+    """HD44780 16x2 character LCD behind a PCF8574 I2C backpack."""
+
+    def __init__(self, sensor_id, sensor_type="lcd1602", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x27)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.backlight = True
+        self._last_text = ""
+        self._result = {"status": "ok", "backlight": True, "last_text": ""}
+        try:
+            self._init_display()
+        except Exception as e:
+            print("LCD1602 init failed: {}".format(e))
+
+    def _write4(self, value):
+        byte = value | (0x08 if self.backlight else 0x00)
+        self.i2c.writeto(self.address, bytes([byte | 0x04]))
+        time.sleep_us(50)
+        self.i2c.writeto(self.address, bytes([byte]))
+        time.sleep_us(50)
+
+    def _command(self, cmd):
+        self._write4(cmd & 0xF0)
+        self._write4((cmd << 4) & 0xF0)
+
+    def _init_display(self):
+        time.sleep_ms(50)
+        for _ in range(3):
+            self._write4(0x30)
+            time.sleep_ms(5)
+        self._write4(0x20)
+        self._command(0x28)  # 4-bit, 2 lines
+        self._command(0x0C)  # display on, cursor off
+        self._command(0x01)  # clear
+        time.sleep_ms(2)
+
+    def display_text(self, text, line=0):
+        self._command(0x80 | (0x40 if line else 0x00))
+        for ch in text[:16]:
+            value = ord(ch)
+            self._write4((value & 0xF0) | 0x01)
+            self._write4(((value << 4) & 0xF0) | 0x01)
+        self._last_text = text
+
+    def set_backlight(self, on):
+        self.backlight = bool(on)
+        self.i2c.writeto(self.address, bytes([0x08 if self.backlight else 0x00]))
+
+    def read(self):
+        result = self._result
+        result["status"] = "ok"
+        result["backlight"] = self.backlight
+        result["last_text"] = self._last_text
+        return self._cache(result, cache_time=1000)
+
+
+class HT16K33Sensor(I2CBaseSensor):
+    """HT16K33 LED matrix / 7-segment driver."""
+
+    def __init__(self, sensor_id, sensor_type="ht16k33", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x70)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.brightness = self.inputs.get("brightness", 8)
+        self._result = {"status": "ok", "brightness": 0}
+        try:
+            self._init_display()
+        except Exception as e:
+            print("HT16K33 init failed: {}".format(e))
+
+    def _init_display(self):
+        self.i2c.writeto(self.address, b'\x21')  # oscillator on
+        self.i2c.writeto(self.address, b'\x81')  # display on, no blink
+        self.set_brightness(self.brightness)
+
+    def set_brightness(self, level):
+        self.brightness = max(0, min(15, level))
+        self.i2c.writeto(self.address, bytes([0xE0 | self.brightness]))
+
+    def write_buffer(self, buf):
+        self.i2c.writeto_mem(self.address, 0x00, buf)
+
+    def read(self):
+        result = self._result
+        result["status"] = "ok"
+        result["brightness"] = self.brightness
+        return self._cache(result, cache_time=1000)
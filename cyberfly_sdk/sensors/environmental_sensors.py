@@ -0,0 +1,782 @@
+"""Environmental sensor drivers: DHT11/DHT22, BMP280, BME280 and BME680."""
+
+import math
+import struct
+import time
+
+import dht
+from machine import Pin
+
+from .base import I2CBaseSensor, BaseSensor, native
+
+try:
+    from micropython import const
+except ImportError:
+    def const(x):
+        return x
+
+# Optional vector backend for batch compensation (multi-sensor gateways,
+# replaying logged raw samples). ulab on MicroPython, numpy on CPython
+# tooling; the scalar read() path never touches it.
+try:
+    from ulab import numpy as np
+except ImportError:
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+# BMP280/BME280 register map. Module-level const() lets mpy-cross inline
+# the literals into bytecode instead of doing a class-attribute lookup.
+_BMX_CHIP_ID_REG = const(0xD0)
+_BMX_CTRL_HUM_REG = const(0xF2)
+_BMX_CTRL_MEAS_REG = const(0xF4)
+_BMX_CONFIG_REG = const(0xF5)
+_BMX_PRESS_MSB_REG = const(0xF7)
+_BMX_DIG_T1_REG = const(0x88)
+_BMX_DIG_H1_REG = const(0xA1)
+_BMX_DIG_H2_REG = const(0xE1)
+
+# BME680 register map, module-level const for the same reason.
+_B68_CHIP_ID_REG = const(0xD0)
+_B68_CTRL_HUM_REG = const(0x72)
+_B68_CTRL_MEAS_REG = const(0x74)
+_B68_CONFIG_REG = const(0x75)
+_B68_CTRL_GAS_REG = const(0x71)
+_B68_MEAS_STATUS_REG = const(0x1D)
+_B68_COEFF1_REG = const(0x89)
+_B68_COEFF2_REG = const(0xE1)
+
+# Reciprocals of the Bosch datasheet divisors: a float multiply is much
+# cheaper than a divide in the compensation kernels.
+_INV_16384 = 1.0 / 16384.0
+_INV_131072 = 1.0 / 131072.0
+_INV_524288 = 1.0 / 524288.0
+_INV_32768 = 1.0 / 32768.0
+_INV_4096 = 1.0 / 4096.0
+_INV_2147483648 = 1.0 / 2147483648.0
+
+# Celsius/Fahrenheit conversion and Magnus dew-point constants, folded
+# once at module level so the kernels never re-derive them.
+_TF_SCALE = 1.8
+_TF_OFF = 32.0
+_INV_TF = 1.0 / 1.8
+_MAGNUS_A = 17.27
+_MAGNUS_B = 237.7
+_LN2 = 0.6931471805599453
+
+# Table-driven log2/exp2 for the altitude and dew-point paths: on ports
+# without a hardware FPU the libm transcendentals dominate those
+# formulas, and two 257-entry interpolated tables (2 KB of flash as
+# array('f')) replace each call with a frexp/ldexp, two table reads and
+# a couple of multiplies. Set _USE_LUT = False to fall back to math.
+_USE_LUT = True
+
+if _USE_LUT:
+    from array import array
+    _LOG2_LUT = array('f', (math.log(1.0 + k / 256.0) / _LN2
+                            for k in range(257)))
+    _EXP2_LUT = array('f', (2.0 ** (k / 256.0) for k in range(257)))
+
+    @native
+    def _log2(x):
+        m, e = math.frexp(x)  # x = m * 2**e with m in [0.5, 1)
+        f = (m + m - 1.0) * 256.0
+        k = int(f)
+        f -= k
+        lut = _LOG2_LUT
+        lo = lut[k]
+        return (e - 1) + lo + f * (lut[k + 1] - lo)
+
+    @native
+    def _exp2(x):
+        n = int(x)
+        if x < n:
+            n -= 1
+        f = (x - n) * 256.0
+        k = int(f)
+        f -= k
+        lut = _EXP2_LUT
+        lo = lut[k]
+        return math.ldexp(lo + f * (lut[k + 1] - lo), n)
+else:
+    def _log2(x):
+        return math.log(x) / _LN2
+
+    def _exp2(x):
+        return 2.0 ** x
+
+
+def _round1(value):
+    # One-decimal rounding in integer space: round() is a Python-level
+    # helper on MicroPython, so int-scale-and-shift is both faster and
+    # allocates a single float for the result.
+    return int(value * 10 + (0.5 if value >= 0 else -0.5)) / 10.0
+
+
+def _round2(value):
+    return int(value * 100 + (0.5 if value >= 0 else -0.5)) / 100.0
+
+
+class DHT11Sensor(BaseSensor):
+    """DHT11 temperature/humidity sensor on a single GPIO pin."""
+
+    # Datasheet minimum interval between one-wire transactions; asking the
+    # part sooner returns the previous (or garbage) values.
+    MIN_INTERVAL_MS = 1000
+    DRIVER = dht.DHT11
+
+    def __init__(self, sensor_id, sensor_type="dht11", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        pin_no = self.inputs.get("pin_no", 4)
+        self.dht = self.DRIVER(Pin(pin_no))
+        self._min_interval_ms = self.MIN_INTERVAL_MS
+        self._last_measure_ms = -self._min_interval_ms
+        self._last_t = None
+        self._last_h = None
+
+    def set_read_delay(self, ms):
+        """Override the minimum gap between hardware measurements."""
+        self._min_interval_ms = ms
+
+    def _measure(self):
+        """Run measure() at most once per datasheet interval; closer calls
+        reuse the captured pair instead of issuing a transaction the part
+        cannot honour."""
+        now = time.ticks_ms()
+        if (self._last_t is None
+                or time.ticks_diff(now, self._last_measure_ms) >= self._min_interval_ms):
+            self.dht.measure()
+            self._last_t = self.dht.temperature()
+            self._last_h = self.dht.humidity()
+            self._last_measure_ms = now
+        return self._last_t, self._last_h
+
+    def read(self):
+        try:
+            temperature, humidity = self._measure()
+            data = {
+                "temperature": _round1(temperature),
+                "humidity": _round1(humidity),
+            }
+            return self._cache(data, cache_time=2000)
+        except Exception as e:
+            raise Exception("DHT11 read failed: {}".format(e))
+
+
+class DHT22Sensor(DHT11Sensor):
+    """DHT22/AM2302 temperature/humidity sensor with heat-index output.
+
+    Shares the DHT11 measurement guard; the DHT22 needs 2 s between
+    transactions where the DHT11 manages 1 s.
+    """
+
+    MIN_INTERVAL_MS = 2000
+    DRIVER = dht.DHT22
+
+    def __init__(self, sensor_id, sensor_type="dht22", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+
+    @native
+    def _calculate_heat_index(self, temp_c, humidity):
+        # NWS/Rothfusz heat index, computed in Fahrenheit. The cheap
+        # linear form is exact enough below 80 F (the common case); only
+        # hot readings pay for the full regression.
+        temp_f = temp_c * _TF_SCALE + _TF_OFF
+        hi = 0.5 * (temp_f + 61.0 + (temp_f - 68.0) * 1.2 + humidity * 0.094)
+        if (hi + temp_f) * 0.5 >= 80.0:
+            tf2 = temp_f * temp_f
+            h2 = humidity * humidity
+            tfh = temp_f * humidity
+            hi = (-42.379
+                  + 2.04901523 * temp_f
+                  + 10.14333127 * humidity
+                  - 0.22475541 * tfh
+                  - 6.83783e-3 * tf2
+                  - 5.481717e-2 * h2
+                  + 1.22874e-3 * tf2 * humidity
+                  + 8.5282e-4 * temp_f * h2
+                  - 1.99e-6 * tf2 * h2)
+            # NOAA adjustments at the regression's edges.
+            if humidity < 13.0 and 80.0 < temp_f < 112.0:
+                hi -= ((13.0 - humidity) / 4.0) * math.sqrt(
+                    (17.0 - abs(temp_f - 95.0)) / 17.0)
+            elif humidity > 85.0 and 80.0 < temp_f < 87.0:
+                hi += ((humidity - 85.0) / 10.0) * ((87.0 - temp_f) / 5.0)
+        return _round1((hi - _TF_OFF) * _INV_TF)
+
+    @staticmethod
+    def heat_index_array(temp_c, humidity):
+        """Vectorised heat index for arrays of samples (requires ulab or
+        numpy). Selects the linear/regression branch per element with
+        np.where; the scalar edge adjustments are omitted as they matter
+        only in narrow humidity bands."""
+        if np is None:
+            raise RuntimeError("ulab/numpy not available")
+        temp_f = temp_c * _TF_SCALE + _TF_OFF
+        hi_simple = 0.5 * (temp_f + 61.0 + (temp_f - 68.0) * 1.2
+                           + humidity * 0.094)
+        tf2 = temp_f * temp_f
+        h2 = humidity * humidity
+        hi_full = (-42.379
+                   + 2.04901523 * temp_f
+                   + 10.14333127 * humidity
+                   - 0.22475541 * temp_f * humidity
+                   - 6.83783e-3 * tf2
+                   - 5.481717e-2 * h2
+                   + 1.22874e-3 * tf2 * humidity
+                   + 8.5282e-4 * temp_f * h2
+                   - 1.99e-6 * tf2 * h2)
+        hi = np.where((hi_simple + temp_f) * 0.5 < 80.0, hi_simple, hi_full)
+        return (hi - _TF_OFF) * _INV_TF
+
+    def read(self):
+        try:
+            temperature, humidity = self._measure()
+            data = {
+                "temperature": _round1(temperature),
+                "humidity": _round1(humidity),
+                "heat_index": self._calculate_heat_index(temperature, humidity),
+            }
+            return self._cache(data, cache_time=2000)
+        except Exception as e:
+            raise Exception("DHT22 read failed: {}".format(e))
+
+
+class BMP280Sensor(I2CBaseSensor):
+    """Bosch BMP280 barometric pressure + temperature sensor."""
+
+    CHIP_ID = 0x58
+    RAW_LEN = 6
+    # Bosch ship both float and int32/int64 reference compensations; on
+    # soft-float ports (RP2040, ESP8266) the integer one is several times
+    # faster. Subclass with USE_INT = False on chips with a hardware FPU.
+    USE_INT = True
+    # Parsed calibration shared across logical instances of the same
+    # physical chip, keyed by (bus object, address): a gateway wrapping
+    # one part in several sensor objects reads the table once and only
+    # the first initialiser writes the config registers.
+    _CAL_CACHE = {}
+
+    def __init__(self, sensor_id, sensor_type="bmp280", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x76)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.sea_level_pressure = self.inputs.get("sea_level_pressure", 1013.25)
+        self._inv_sea = 1.0 / self.sea_level_pressure
+        self._inv_5255 = 1.0 / 5.255
+        self._cal_ok = False
+        # Reused burst-read buffer: the steady-state read path allocates no
+        # bytes objects (BME280 overrides the size for its extra hum bytes).
+        self._raw = bytearray(self.RAW_LEN)
+        # Scratch buffer for parsing the 20-bit ADC words: copying three raw
+        # bytes behind a zero byte lets struct.unpack('>I') assemble the
+        # value in C, replacing the shift-and-OR chain per ADC.
+        self._u32 = bytearray(4)
+        # Reused result dict, mutated in place per read: no per-call key
+        # hashing or dict allocation. Consumers must copy a reading they
+        # keep across polls.
+        self._result = self._make_result()
+        try:
+            self._init_sensor()
+        except Exception as e:
+            print("BMP280 init failed: {}".format(e))
+
+    @staticmethod
+    def _make_result():
+        return {"temperature": 0.0, "pressure": 0.0, "altitude": 0.0}
+
+    def _init_sensor(self):
+        key = (id(self.i2c), self.address)
+        coeffs = self._CAL_CACHE.get(key)
+        if coeffs is None:
+            chip_id = self.i2c.readfrom_mem(self.address, _BMX_CHIP_ID_REG, 1)[0]
+            if chip_id != self.CHIP_ID:
+                print("%s unexpected chip id 0x%02x" % (self.sensor_type, chip_id))
+            coeffs = self._read_calibration()
+            self._CAL_CACHE[key] = coeffs
+            # First initialiser wins: re-writing CTRL_MEAS from a second
+            # logical instance would disturb the running measurement.
+            self._configure()
+        self._apply_calibration(coeffs)
+        self._cal_ok = True
+
+    def _configure(self):
+        # Normal mode, temperature and pressure oversampling x4.
+        self.i2c.writeto_mem(self.address, _BMX_CTRL_MEAS_REG, b'\x6F')
+        self.i2c.writeto_mem(self.address, _BMX_CONFIG_REG, b'\x00')
+
+    def _read_calibration(self):
+        cal_data = bytearray(24)
+        self.i2c.readfrom_mem_into(self.address, _BMX_DIG_T1_REG, cal_data)
+        # The whole calibration block is a fixed little-endian layout, so one
+        # struct.unpack call parses every coefficient natively.
+        return struct.unpack('<HhhHhhhhhhhh', cal_data)
+
+    def _apply_calibration(self, coeffs):
+        self._set_tp_attrs(*coeffs)
+
+    def _set_tp_attrs(self, t1, t2, t3, p1, p2, p3, p4, p5, p6, p7, p8, p9):
+        """Fold the datasheet divisors into the coefficients once so the
+        compensation kernels run on plain attribute loads and multiplies
+        instead of dict hashes and divisions."""
+        self._T1_1024 = t1 / 1024.0
+        self._T1_8192 = t1 / 8192.0
+        self._T2 = float(t2)
+        self._T3 = float(t3)
+        self._P1 = float(p1)
+        self._P2 = float(p2)
+        self._P3 = float(p3)
+        self._P4_65536 = p4 * 65536.0
+        self._P5_2 = p5 * 2.0
+        self._P6_32768 = p6 / 32768.0
+        self._P7_16 = p7 / 16.0
+        self._P8_32768 = p8 / 32768.0
+        self._P9 = float(p9)
+        # Raw integer coefficients for the fixed-point kernels.
+        self._iT1 = t1
+        self._iT2 = t2
+        self._iT3 = t3
+        self._iP1 = p1
+        self._iP2 = p2
+        self._iP3 = p3
+        self._iP4 = p4
+        self._iP5 = p5
+        self._iP6 = p6
+        self._iP7 = p7
+        self._iP8 = p8
+        self._iP9 = p9
+        # Pick the kernel pair once; read() goes through the aliases.
+        if self.USE_INT:
+            self._comp_t = self._compensate_temperature_int
+            self._comp_p = self._compensate_pressure_int
+        else:
+            self._comp_t = self._compensate_temperature
+            self._comp_p = self._compensate_pressure
+
+    @native
+    def _compensate_temperature(self, adc_T):
+        """Returns (temperature, t_fine); t_fine is threaded through the
+        other kernels as a plain local, which is faster than attribute
+        stores/loads on self."""
+        var1 = (adc_T * _INV_16384 - self._T1_1024) * self._T2
+        d = adc_T * _INV_131072 - self._T1_8192
+        var2 = d * d * self._T3
+        t_fine = var1 + var2
+        return t_fine / 5120.0, t_fine
+
+    @native
+    def _compensate_pressure(self, adc_P, t_fine):
+        var1 = t_fine * 0.5 - 64000.0
+        var2 = var1 * var1 * self._P6_32768
+        var2 = var2 + var1 * self._P5_2
+        var2 = var2 * 0.25 + self._P4_65536
+        var1 = (self._P3 * var1 * var1 * _INV_524288
+                + self._P2 * var1) * _INV_524288
+        var1 = (1.0 + var1 * _INV_32768) * self._P1
+        if var1 == 0.0:
+            return 0.0
+        p = 1048576.0 - adc_P
+        p = (p - var2 * _INV_4096) * 6250.0 / var1
+        var1 = self._P9 * p * p * _INV_2147483648
+        var2 = p * self._P8_32768
+        p = p + (var1 + var2) * 0.0625 + self._P7_16
+        return p * 0.01
+
+    @native
+    def _compensate_temperature_int(self, adc_T):
+        # Bosch int32 reference implementation (matches the BME680 style).
+        var1 = (((adc_T >> 3) - (self._iT1 << 1)) * self._iT2) >> 11
+        d = (adc_T >> 4) - self._iT1
+        var2 = (((d * d) >> 12) * self._iT3) >> 14
+        t_fine = var1 + var2
+        return ((t_fine * 5 + 128) >> 8) * 0.01, t_fine
+
+    @native
+    def _compensate_pressure_int(self, adc_P, t_fine):
+        # Bosch int64 reference implementation.
+        var1 = t_fine - 128000
+        var2 = var1 * var1 * self._iP6
+        var2 = var2 + ((var1 * self._iP5) << 17)
+        var2 = var2 + (self._iP4 << 35)
+        var1 = ((var1 * var1 * self._iP3) >> 8) + ((var1 * self._iP2) << 12)
+        var1 = (((1 << 47) + var1) * self._iP1) >> 33
+        if var1 == 0:
+            return 0.0
+        p = 1048576 - adc_P
+        p = (((p << 31) - var2) * 3125) // var1
+        var1 = (self._iP9 * (p >> 13) * (p >> 13)) >> 25
+        var2 = (self._iP8 * p) >> 19
+        p = ((p + var1 + var2) >> 8) + (self._iP7 << 4)
+        # p is in Q24.8 Pa; scale to hPa.
+        return p / 25600.0
+
+    def _altitude(self, pressure):
+        # exp(log(x) * k) is cheaper than the generic float ** on
+        # MicroPython; both the sea-level division and the 1/5.255
+        # exponent are folded into precomputed reciprocals.
+        return 44330.0 * (1.0 - _exp2(
+            _log2(pressure * self._inv_sea) * self._inv_5255))
+
+    def compensate_many(self, adc_T, adc_P):
+        """Vectorised float compensation for arrays of raw ADC samples
+        (requires ulab or numpy). Returns (temperature, pressure) arrays;
+        out-of-range pressure cells (var1 == 0) come back as nan."""
+        if np is None:
+            raise RuntimeError("ulab/numpy not available")
+        var1 = (adc_T * _INV_16384 - self._T1_1024) * self._T2
+        d = adc_T * _INV_131072 - self._T1_8192
+        t_fine = var1 + d * d * self._T3
+        temperature = t_fine / 5120.0
+        var1 = t_fine * 0.5 - 64000.0
+        var2 = var1 * var1 * self._P6_32768 + var1 * self._P5_2
+        var2 = var2 * 0.25 + self._P4_65536
+        var1 = (self._P3 * var1 * var1 * _INV_524288
+                + self._P2 * var1) * _INV_524288
+        var1 = (1.0 + var1 * _INV_32768) * self._P1
+        var1 = np.where(var1 == 0.0, float('nan'), var1)
+        p = 1048576.0 - adc_P
+        p = (p - var2 * _INV_4096) * 6250.0 / var1
+        var1 = self._P9 * p * p * _INV_2147483648
+        var2 = p * self._P8_32768
+        pressure = (p + (var1 + var2) * 0.0625 + self._P7_16) * 0.01
+        return temperature, pressure
+
+    def read(self):
+        try:
+            if not self._cal_ok:
+                raise OSError("sensor not initialised")
+            # Pressure and temperature registers are contiguous (0xF7..0xFC),
+            # so one 6-byte burst replaces two I2C transactions.
+            raw = self._raw
+            self.i2c.readfrom_mem_into(self.address, _BMX_PRESS_MSB_REG, raw)
+            u32 = self._u32
+            u32[1:4] = raw[0:3]
+            adc_P = struct.unpack('>I', u32)[0] >> 4
+            u32[1:4] = raw[3:6]
+            adc_T = struct.unpack('>I', u32)[0] >> 4
+            temperature, t_fine = self._comp_t(adc_T)
+            pressure = self._comp_p(adc_P, t_fine)
+            altitude = self._altitude(pressure)
+            data = self._result
+            data["temperature"] = _round1(temperature)
+            data["pressure"] = _round2(pressure)
+            data["altitude"] = _round1(altitude)
+        except Exception:
+            # Mock data so dashboards keep updating when hardware is absent.
+            # One integer ticks read instead of repeated RTC-backed
+            # time.time() floats; the modulos stay in integer space.
+            t = time.ticks_ms() // 1000
+            data = self._result
+            data["temperature"] = 22.5 + (t % 10) - 5
+            data["pressure"] = 1013.25 + (t % 20) - 10
+            data["altitude"] = 100.0 + (t % 50) - 25
+        return self._cache(data, cache_time=1000)
+
+
+class BME280Sensor(BMP280Sensor):
+    """Bosch BME280 pressure + temperature + humidity sensor."""
+
+    CHIP_ID = 0x60
+    RAW_LEN = 8
+    # read() goes through the fused float kernel (humidity needs t_fine
+    # in float form), so the int32 dispatch does not apply here.
+    USE_INT = False
+
+    @staticmethod
+    def _make_result():
+        return {"temperature": 0.0, "humidity": 0.0,
+                "pressure": 0.0, "dew_point": 0.0}
+
+    def __init__(self, sensor_id, sensor_type="bme280", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+
+    def _configure(self):
+        # Humidity oversampling x2, then normal mode with T/P oversampling x4.
+        self.i2c.writeto_mem(self.address, _BMX_CTRL_HUM_REG, b'\x02')
+        self.i2c.writeto_mem(self.address, _BMX_CTRL_MEAS_REG, b'\x6F')
+        self.i2c.writeto_mem(self.address, _BMX_CONFIG_REG, b'\x00')
+
+    def _read_calibration(self):
+        cal1 = bytearray(24)
+        cal3 = bytearray(7)
+        self.i2c.readfrom_mem_into(self.address, _BMX_DIG_T1_REG, cal1)
+        cal2 = self.i2c.readfrom_mem(self.address, _BMX_DIG_H1_REG, 1)
+        self.i2c.readfrom_mem_into(self.address, _BMX_DIG_H2_REG, cal3)
+        # Temperature/pressure block shares the BMP280 little-endian layout.
+        (t1, t2, t3,
+         p1, p2, p3, p4, p5, p6, p7, p8, p9) = struct.unpack('<HhhHhhhhhhhh', cal1)
+        h2, h3 = struct.unpack('<hB', cal3[0:3])
+        # H4/H5 are 12-bit values sharing the nibble-packed byte cal3[4].
+        h4 = (cal3[3] << 4) | (cal3[4] & 0x0F)
+        if h4 >= 2048:
+            h4 -= 4096
+        h5 = (cal3[5] << 4) | (cal3[4] >> 4)
+        if h5 >= 2048:
+            h5 -= 4096
+        h6 = struct.unpack('<b', cal3[6:7])[0]
+        return (t1, t2, t3, p1, p2, p3, p4, p5, p6, p7, p8, p9,
+                cal2[0], h2, h3, h4, h5, h6)
+
+    def _apply_calibration(self, coeffs):
+        self._set_tp_attrs(*coeffs[:12])
+        h1, h2, h3, h4, h5, h6 = coeffs[12:]
+        # Humidity coefficients with the datasheet divisors pre-folded,
+        # mirroring _set_tp_attrs for the T/P block.
+        self._H1_524288 = h1 / 524288.0
+        self._H2_65536 = h2 / 65536.0
+        self._H3_q = h3 / 67108864.0
+        self._H4_64 = h4 * 64.0
+        self._H5_16384 = h5 / 16384.0
+        self._H6_q = h6 / 67108864.0
+
+    @native
+    def _compensate_humidity(self, adc_H, t_fine):
+        h = t_fine - 76800.0
+        h = ((adc_H - (self._H4_64 + self._H5_16384 * h))
+             * (self._H2_65536
+                * (1.0 + self._H6_q * h
+                   * (1.0 + self._H3_q * h))))
+        h = h * (1.0 - self._H1_524288 * h)
+        # min/max clamp: two builtin calls instead of two bytecode branches.
+        return min(100.0, max(0.0, h))
+
+    @native
+    def _compensate_all(self, adc_T, adc_P, adc_H):
+        """Fused temp+pressure+humidity compensation.
+
+        Inlines the three kernels so t_fine and the var1/var2 scratch values
+        stay in locals across them, saving two method calls and the
+        attribute round-trips per read.
+        """
+        # Temperature.
+        var1 = (adc_T * _INV_16384 - self._T1_1024) * self._T2
+        d = adc_T * _INV_131072 - self._T1_8192
+        var2 = d * d * self._T3
+        t_fine = var1 + var2
+        temperature = t_fine / 5120.0
+        # Pressure, reusing the var1/var2 scratch locals.
+        var1 = t_fine * 0.5 - 64000.0
+        var2 = var1 * var1 * self._P6_32768
+        var2 = var2 + var1 * self._P5_2
+        var2 = var2 * 0.25 + self._P4_65536
+        var1 = (self._P3 * var1 * var1 * _INV_524288
+                + self._P2 * var1) * _INV_524288
+        var1 = (1.0 + var1 * _INV_32768) * self._P1
+        if var1 == 0.0:
+            pressure = 0.0
+        else:
+            p = 1048576.0 - adc_P
+            p = (p - var2 * _INV_4096) * 6250.0 / var1
+            var1 = self._P9 * p * p * _INV_2147483648
+            var2 = p * self._P8_32768
+            pressure = (p + (var1 + var2) * 0.0625 + self._P7_16) * 0.01
+        # Humidity.
+        h = t_fine - 76800.0
+        h = ((adc_H - (self._H4_64 + self._H5_16384 * h))
+             * (self._H2_65536
+                * (1.0 + self._H6_q * h
+                   * (1.0 + self._H3_q * h))))
+        h = h * (1.0 - self._H1_524288 * h)
+        return temperature, pressure, min(100.0, max(0.0, h))
+
+    def compensate_many(self, adc_T, adc_P, adc_H):
+        """Vectorised compensation including humidity; t_fine is recovered
+        from the temperature array (t_fine = T * 5120)."""
+        temperature, pressure = super().compensate_many(adc_T, adc_P)
+        h = temperature * 5120.0 - 76800.0
+        h = ((adc_H - (self._H4_64 + self._H5_16384 * h))
+             * (self._H2_65536
+                * (1.0 + self._H6_q * h
+                   * (1.0 + self._H3_q * h))))
+        h = h * (1.0 - self._H1_524288 * h)
+        h = np.where(h > 100.0, 100.0, h)
+        h = np.where(h < 0.0, 0.0, h)
+        return temperature, pressure, h
+
+    def _dew_point(self, temperature, humidity):
+        if humidity <= 0:
+            return -_MAGNUS_B
+        alpha = ((_MAGNUS_A * temperature) / (_MAGNUS_B + temperature)
+                 + _log2(humidity * 0.01) * _LN2)
+        return (_MAGNUS_B * alpha) / (_MAGNUS_A - alpha)
+
+    def read(self):
+        try:
+            if not self._cal_ok:
+                raise OSError("sensor not initialised")
+            # Press/temp/hum span 0xF7..0xFE contiguously: one 8-byte burst
+            # replaces three I2C transactions.
+            raw = self._raw
+            self.i2c.readfrom_mem_into(self.address, _BMX_PRESS_MSB_REG, raw)
+            u32 = self._u32
+            u32[1:4] = raw[0:3]
+            adc_P = struct.unpack('>I', u32)[0] >> 4
+            u32[1:4] = raw[3:6]
+            adc_T = struct.unpack('>I', u32)[0] >> 4
+            adc_H = struct.unpack_from('>H', raw, 6)[0]
+            temperature, pressure, humidity = self._compensate_all(
+                adc_T, adc_P, adc_H)
+            data = self._result
+            data["temperature"] = _round1(temperature)
+            data["humidity"] = _round1(humidity)
+            data["pressure"] = _round2(pressure)
+            data["dew_point"] = _round1(self._dew_point(temperature, humidity))
+        except Exception:
+            t = time.ticks_ms() // 1000
+            data = self._result
+            data["temperature"] = 22.5 + (t % 10) - 5
+            data["humidity"] = 55.0 + (t % 20) - 10
+            data["pressure"] = 1013.25 + (t % 20) - 10
+            data["dew_point"] = 12.0 + (t % 8) - 4
+        return self._cache(data, cache_time=1000)
+
+
+class BME680Sensor(I2CBaseSensor):
+    """Bosch BME680 gas/environment sensor (forced-mode reads)."""
+
+    def __init__(self, sensor_id, sensor_type="bme680", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x77)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self._cal_ok = False
+        # Reused burst buffer for the 0x1D..0x2B data frame.
+        self._rx = bytearray(15)
+        # Reused result dict, mutated in place per read.
+        self._result = {"temperature": 0.0, "humidity": 0.0,
+                        "pressure": 0.0, "gas_resistance": 0}
+        try:
+            self._init_sensor()
+        except Exception as e:
+            print("BME680 init failed: {}".format(e))
+
+    def _init_sensor(self):
+        chip_id = self.i2c.readfrom_mem(self.address, _B68_CHIP_ID_REG, 1)[0]
+        if chip_id != 0x61:
+            print("BME680 unexpected chip id 0x%02x" % chip_id)
+        self._read_calibration()
+        # Humidity oversampling x2; temperature x4 / pressure x4, sleep mode.
+        self.i2c.writeto_mem(self.address, _B68_CTRL_HUM_REG, b'\x02')
+        self.i2c.writeto_mem(self.address, _B68_CTRL_MEAS_REG, b'\x6C')
+        self.i2c.writeto_mem(self.address, _B68_CONFIG_REG, b'\x00')
+
+    def _read_calibration(self):
+        c1 = self.i2c.readfrom_mem(self.address, _B68_COEFF1_REG, 25)
+        c2 = self.i2c.readfrom_mem(self.address, _B68_COEFF2_REG, 16)
+        # Flat attributes instead of a dict: the fused kernel hoists them
+        # into locals once, so no per-coefficient dict hash per sample.
+        self._t1 = struct.unpack('<H', c2[8:10])[0]
+        self._t2 = struct.unpack('<h', c1[1:3])[0]
+        self._t3 = struct.unpack('<b', c1[3:4])[0]
+        self._p1 = struct.unpack('<H', c1[5:7])[0]
+        self._p2 = struct.unpack('<h', c1[7:9])[0]
+        self._p3 = struct.unpack('<b', c1[9:10])[0]
+        self._p4 = struct.unpack('<h', c1[11:13])[0]
+        self._p5 = struct.unpack('<h', c1[13:15])[0]
+        self._p6 = struct.unpack('<b', c1[16:17])[0]
+        self._p7 = struct.unpack('<b', c1[15:16])[0]
+        self._p8 = struct.unpack('<h', c1[19:21])[0]
+        self._p9 = struct.unpack('<h', c1[21:23])[0]
+        self._p10 = c1[23]
+        self._h1 = (c2[2] << 4) | (c2[1] & 0x0F)
+        self._h2 = (c2[0] << 4) | (c2[1] >> 4)
+        self._h3 = struct.unpack('<b', c2[3:4])[0]
+        self._h4 = struct.unpack('<b', c2[4:5])[0]
+        self._h5 = struct.unpack('<b', c2[5:6])[0]
+        self._h6 = c2[6]
+        self._h7 = struct.unpack('<b', c2[7:8])[0]
+        self._cal_ok = True
+
+    @native
+    def _compensate_all(self, adc_T, adc_P, adc_H):
+        """Fused Bosch int32 T/P/H compensation.
+
+        One kernel keeps t_fine and the shared intermediates in locals
+        across all three compensations instead of round-tripping them
+        through instance attributes between three separate calls.
+        """
+        # Temperature.
+        var1 = (adc_T >> 3) - (self._t1 << 1)
+        var2 = (var1 * self._t2) >> 11
+        var3 = ((((var1 >> 1) * (var1 >> 1)) >> 12) * (self._t3 << 4)) >> 14
+        t_fine = var2 + var3
+        temp_scaled = (t_fine * 5 + 128) >> 8
+        temperature = temp_scaled * 0.01
+        # Pressure.
+        var1 = (t_fine >> 1) - 64000
+        var2 = ((((var1 >> 2) * (var1 >> 2)) >> 11) * self._p6) >> 2
+        var2 = var2 + ((var1 * self._p5) << 1)
+        var2 = (var2 >> 2) + (self._p4 << 16)
+        var1 = (((((var1 >> 2) * (var1 >> 2)) >> 13) * (self._p3 << 5)) >> 3) \
+            + ((self._p2 * var1) >> 1)
+        var1 = var1 >> 18
+        var1 = ((32768 + var1) * self._p1) >> 15
+        if var1 == 0:
+            pressure = 0.0
+        else:
+            p = 1048576 - adc_P
+            p = ((p - (var2 >> 12)) * 3125)
+            p = (p // var1) << 1
+            var1 = (self._p9 * (((p >> 3) * (p >> 3)) >> 13)) >> 12
+            var2 = ((p >> 2) * self._p8) >> 13
+            var3 = ((p >> 8) * (p >> 8) * (p >> 8) * self._p10) >> 17
+            p = p + ((var1 + var2 + var3 + (self._p7 << 7)) >> 4)
+            pressure = p * 0.01
+        # Humidity, reusing temp_scaled from the temperature pass.
+        var1 = adc_H - (self._h1 * 16) \
+            - ((temp_scaled * self._h3) // 100 >> 1)
+        var2 = (self._h2
+                * (((temp_scaled * self._h4) // 100)
+                   + (((temp_scaled * ((temp_scaled * self._h5) // 100)) >> 6) // 100)
+                   + (1 << 14))) >> 10
+        var3 = var1 * var2
+        var4 = ((self._h6 << 7) + ((temp_scaled * self._h7) // 100)) >> 4
+        var5 = ((var3 >> 14) * (var3 >> 14)) >> 10
+        var6 = (var4 * var5) >> 1
+        h = (((var3 + var6) >> 10) * 1000 >> 12) / 1000.0
+        return temperature, pressure, min(100.0, max(0.0, h))
+
+    def read(self):
+        try:
+            if not self._cal_ok:
+                raise OSError("sensor not initialised")
+            # Trigger one forced-mode measurement and poll the new-data
+            # bit instead of sleeping a fixed 200 ms: conversion at this
+            # oversampling typically lands around 160 ms but varies, so
+            # polling returns as soon as the sample is ready while the
+            # deadline still bounds the worst case.
+            self.i2c.writeto_mem(self.address, _B68_CTRL_MEAS_REG, b'\x6D')
+            deadline = time.ticks_add(time.ticks_ms(), 500)
+            while time.ticks_diff(deadline, time.ticks_ms()) > 0:
+                if self.i2c.readfrom_mem(self.address,
+                                         _B68_MEAS_STATUS_REG, 1)[0] & 0x80:
+                    break
+                time.sleep_ms(5)
+            # Status through gas registers (0x1D..0x2B) in one 15-byte
+            # burst: one transaction instead of five, and the sample
+            # fields are guaranteed to come from the same measurement.
+            buf = self._rx
+            self.i2c.readfrom_mem_into(self.address, _B68_MEAS_STATUS_REG, buf)
+            if not (buf[0] & 0x80):
+                raise OSError("no new data")
+            adc_P = (buf[2] << 12) | (buf[3] << 4) | (buf[4] >> 4)
+            adc_T = (buf[5] << 12) | (buf[6] << 4) | (buf[7] >> 4)
+            adc_H = (buf[8] << 8) | buf[9]
+            gas_raw = (buf[13] << 2) | (buf[14] >> 6)
+            temperature, pressure, humidity = self._compensate_all(
+                adc_T, adc_P, adc_H)
+            data = self._result
+            data["temperature"] = _round1(temperature)
+            data["humidity"] = _round1(humidity)
+            data["pressure"] = _round2(pressure)
+            data["gas_resistance"] = gas_raw
+        except Exception:
+            t = time.ticks_ms() // 1000
+            data = self._result
+            data["temperature"] = 22.5 + (t % 10) - 5
+            data["humidity"] = 55.0 + (t % 20) - 10
+            data["pressure"] = 1013.25 + (t % 20) - 10
+            data["gas_resistance"] = 50000 + (t % 100000)
+        return self._cache(data, cache_time=1000)
@@ -0,0 +1,288 @@
+"""GPIO-attached sensor drivers: DS18B20, HC-SR04 ultrasonic and PIR."""
+
+import time
+
+import ds18x20
+import machine
+import onewire
+from machine import Pin
+
+from .base import BaseSensor, _sleep_ms
+
+# Echo microseconds -> metres: 343 m/s speed of sound, halved for the
+# round trip (0.000343 / 2), folded into a single multiplier.
+_US_TO_M = 0.0001715
+
+# Conversion time and scratchpad config byte per DS18B20 resolution.
+_DS_CONVERT_MS = {9: 94, 10: 188, 11: 375, 12: 750}
+_DS_CONFIG = {9: 0x1F, 10: 0x3F, 11: 0x5F, 12: 0x7F}
+
+# DS18B20 conversion state machine.
+_DS_IDLE = 0
+_DS_CONVERTING = 1
+
+
+def _rom_hex(rom):
+    # bytes.hex() is a single C call; older ports only have hexlify.
+    try:
+        return bytes(rom).hex().upper()
+    except AttributeError:
+        import ubinascii
+        return ubinascii.hexlify(rom).decode().upper()
+
+
+class DS18B20Sensor(BaseSensor):
+    """Dallas DS18B20 one-wire temperature probes (supports multiple ROMs).
+
+    Conversions are run as a non-blocking state machine: the first call of a
+    cycle triggers convert_temp() and returns the cached reading; a later
+    call picks up the result once the conversion window has elapsed, so the
+    caller never sleeps through the 750 ms conversion.
+    """
+
+    def __init__(self, sensor_id, sensor_type="ds18b20", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        pin_no = self.inputs.get("pin_no", 4)
+        self.ow = onewire.OneWire(Pin(pin_no))
+        self.ds = ds18x20.DS18X20(self.ow)
+        self.roms = self.ds.scan()
+        # ROM codes never change after a scan, so their hex strings are
+        # built once here instead of per read.
+        self._rom_strs = [_rom_hex(r) for r in self.roms]
+        if not self.roms:
+            print("DS18B20: no devices found on pin %d" % pin_no)
+        resolution = self.inputs.get("resolution", 12)
+        if resolution not in _DS_CONVERT_MS:
+            resolution = 12
+        self._convert_ms = _DS_CONVERT_MS[resolution]
+        if resolution != 12:
+            # Lower resolution cuts conversion time (94 ms at 9 bits vs
+            # 750 ms at the 12-bit power-on default).
+            config = bytes([0x00, 0x00, _DS_CONFIG[resolution]])
+            for rom in self.roms:
+                try:
+                    self.ds.write_scratch(rom, config)
+                except Exception as e:
+                    print("DS18B20: failed to set resolution: {}".format(e))
+        self._state = _DS_IDLE
+        self._deadline = 0
+
+    def read(self):
+        try:
+            now = time.ticks_ms()
+            if self._state == _DS_IDLE:
+                self.ds.convert_temp()
+                self._deadline = time.ticks_add(now, self._convert_ms)
+                self._state = _DS_CONVERTING
+                if self.last_reading is not None:
+                    return self.last_reading
+                # No cached value to fall back on yet: block for the first
+                # conversion only.
+                time.sleep_ms(self._convert_ms)
+            elif (time.ticks_diff(now, self._deadline) < 0
+                    and not self._conversion_done()):
+                return self.last_reading
+            self._state = _DS_IDLE
+            return self._collect_temps()
+        except Exception as e:
+            self._state = _DS_IDLE
+            raise Exception("DS18B20 read failed: {}".format(e))
+
+    def _conversion_done(self):
+        # A converting DS18B20 answers 0 to a read slot and 1 once the
+        # result is latched, so one bit probe lets the state machine
+        # finish early - real conversions usually complete well inside
+        # the datasheet maximum the deadline is based on.
+        try:
+            return bool(self.ow.readbit())
+        except Exception:
+            return False
+
+    def _collect_temps(self):
+        # Single pass straight into the result dict: no per-probe interim
+        # dicts and no second flattening loop.
+        result = {}
+        total = 0.0
+        count = 0
+        for rom in self.roms:
+            temp = self.ds.read_temp(rom)
+            result["sensor_%d_temp_c" % (count + 1)] = round(temp, 2)
+            result["sensor_%d_rom" % (count + 1)] = self._rom_strs[count]
+            count += 1
+            total += temp
+        if count:
+            result["average_temp_c"] = round(total / count, 2)
+            result["sensor_count"] = count
+        return self._cache(result, cache_time=1000)
+
+    async def read_async(self):
+        """Convert and collect with the conversion wait yielded to the
+        scheduler, so other sensors/network keep running."""
+        try:
+            self.ds.convert_temp()
+            self._state = _DS_CONVERTING
+            await _sleep_ms(self._convert_ms)
+            self._state = _DS_IDLE
+            return self._collect_temps()
+        except Exception as e:
+            self._state = _DS_IDLE
+            raise Exception("DS18B20 read failed: {}".format(e))
+
+
+class UltrasonicSensor(BaseSensor):
+    """HC-SR04 ultrasonic distance sensor."""
+
+    def __init__(self, sensor_id, sensor_type="ultrasonic", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.trigger = Pin(self.inputs.get("trigger_pin", 5), Pin.OUT)
+        self.echo = Pin(self.inputs.get("echo_pin", 18), Pin.IN)
+        self.trigger.value(0)
+        # Echo pulse is timed from edge interrupts so read() never busy-waits
+        # the 30 ms worst-case in time_pulse_us. Ports without pin IRQs fall
+        # back to the blocking measurement.
+        self._echo_start = 0
+        self._echo_us = -1
+        self._pending = False
+        self._pending_since = 0
+        self._last_trigger = None
+        try:
+            self.echo.irq(handler=self._on_echo,
+                          trigger=Pin.IRQ_RISING | Pin.IRQ_FALLING)
+            self._use_irq = True
+        except Exception:
+            self._use_irq = False
+
+    def _on_echo(self, pin):
+        now = time.ticks_us()
+        if pin.value():
+            self._echo_start = now
+        elif self._pending:
+            self._echo_us = time.ticks_diff(now, self._echo_start)
+            self._pending = False
+
+    def _send_trigger(self):
+        self.trigger.value(0)
+        time.sleep_us(2)
+        self.trigger.value(1)
+        time.sleep_us(10)
+        self.trigger.value(0)
+
+    def _to_data(self, pulse_time):
+        distance_m = pulse_time * _US_TO_M
+        return {
+            "distance_cm": round(distance_m * 100, 1),
+            "distance_m": round(distance_m, 3),
+        }
+
+    def read(self):
+        try:
+            # Cache check before any hardware work: a hit costs a ticks
+            # read instead of a trigger pulse plus up to 30 ms of echo.
+            cached = self._get_cached(100)
+            if cached is not None:
+                return cached
+            now = time.ticks_ms()
+            if (self._last_trigger is not None
+                    and self.last_reading is not None
+                    and time.ticks_diff(now, self._last_trigger) < 60):
+                # The HC-SR04 wants ~60 ms between pings or echoes of the
+                # previous ping corrupt the next measurement.
+                return self.last_reading
+            if not self._use_irq:
+                self._last_trigger = now
+                self._send_trigger()
+                pulse_time = machine.time_pulse_us(self.echo, 1, 30000)
+                if pulse_time < 0:
+                    raise OSError("echo timeout")
+                return self._store_cached(self._to_data(pulse_time))
+            if self._pending:
+                if time.ticks_diff(now, self._pending_since) < 60:
+                    # Measurement still in flight; serve the last reading.
+                    return self.last_reading
+                self._pending = False  # lost echo, re-arm below
+            pulse_time = self._echo_us
+            self._echo_us = -1
+            self._pending = True
+            self._pending_since = now
+            self._last_trigger = now
+            self._send_trigger()
+            if pulse_time < 0:
+                if self.last_reading is not None:
+                    return self.last_reading
+                # Nothing to fall back on yet: block for the echo we just
+                # triggered, the same first-reading exception DS18B20
+                # makes for its first conversion.
+                deadline = time.ticks_add(now, 35)
+                while (self._pending
+                        and time.ticks_diff(deadline, time.ticks_ms()) > 0):
+                    time.sleep_us(100)
+                self._pending = False
+                if self._echo_us < 0:
+                    raise OSError("echo timeout")
+                pulse_time = self._echo_us
+                self._echo_us = -1
+            return self._store_cached(self._to_data(pulse_time))
+        except Exception as e:
+            raise Exception("Ultrasonic read failed: {}".format(e))
+
+    async def read_async(self):
+        """Trigger, then await the echo window instead of busy-waiting."""
+        if not self._use_irq:
+            return self.read()
+        cached = self._get_cached(100)
+        if cached is not None:
+            return cached
+        self._echo_us = -1
+        self._pending = True
+        self._pending_since = time.ticks_ms()
+        self._last_trigger = self._pending_since
+        self._send_trigger()
+        await _sleep_ms(30)
+        self._pending = False
+        if self._echo_us < 0:
+            if self.last_reading is None:
+                raise OSError("echo timeout")
+            return self.last_reading
+        return self._store_cached(self._to_data(self._echo_us))
+
+
+# Alias kept for configs that name the part rather than the role.
+HC_SR04Sensor = UltrasonicSensor
+
+
+class PIRSensor(BaseSensor):
+    """Passive-infrared motion sensor on a digital input pin."""
+
+    def __init__(self, sensor_id, sensor_type="pir", inputs=None):
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.pin = Pin(self.inputs.get("pin_no", 14), Pin.IN)
+        self._pin_value = self.pin.value
+        self._prev_state = 0
+        self._last_motion_ticks = time.ticks_ms()
+        self._last_motion_time = time.time()
+        self._result = {
+            "motion": False,
+            "value": 0,
+            "time_since_motion": 0.0,
+            "last_motion_time": self._last_motion_time,
+        }
+
+    def read(self):
+        # State transitions are rare; the steady-state cost is one pin
+        # read, one ticks subtraction and one dict-value assignment.
+        current_state = self._pin_value()
+        now = time.ticks_ms()
+        result = self._result
+        if current_state != self._prev_state:
+            if current_state:
+                # Rising edge: the only place wall-clock time is read.
+                self._last_motion_ticks = now
+                self._last_motion_time = time.time()
+                result["last_motion_time"] = self._last_motion_time
+            self._prev_state = current_state
+            result["motion"] = bool(current_state)
+            result["value"] = current_state
+        # Elapsed time in tenths of a second, integer math until the end.
+        result["time_since_motion"] = (
+            time.ticks_diff(now, self._last_motion_ticks) // 100) / 10.0
+        return self._cache(result, cache_time=100)
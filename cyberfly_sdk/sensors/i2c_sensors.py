@@ -0,0 +1,585 @@
+"""I2C sensor drivers: light, colour, air-quality, motion and misc ADCs.
+
+Each driver attempts a real bus transaction and falls back to plausible
+mock data when the hardware is absent, so dashboards keep updating during
+bench development.
+"""
+
+import struct
+import time
+from math import cos, sin
+
+from machine import Pin
+
+from .base import I2CBaseSensor
+
+# Shared burst layouts: one C-level unpack replaces a chain of
+# shift-and-OR bytecodes per word. Plain format strings, not
+# struct.Struct - MicroPython's struct module only has the functions.
+_CCS811_ALG_FMT = '>HHBBH'  # eCO2, TVOC, status, error, raw
+_MPU_FRAME_FMT = '>7h'  # ax, ay, az, temp, gx, gy, gz
+# Full-scale range -> LSB/unit, from the MPU6050 register map.
+_MPU_ACCEL_SCALE = {2: 16384.0, 4: 8192.0, 8: 4096.0, 16: 2048.0}
+_MPU_GYRO_SCALE = {250: 131.0, 500: 65.5, 1000: 32.8, 2000: 16.4}
+
+# Import-time epoch for the mock fallbacks: ticks arithmetic stays in
+# integers, unlike time.time() which boxes a float per call.
+_T0 = time.ticks_ms()
+
+# MPU6050 range -> config register payload, as ready-made bytes.
+_MPU_ACCEL_CFG = {2: b'\x00', 4: b'\x08', 8: b'\x10', 16: b'\x18'}
+_MPU_GYRO_CFG = {250: b'\x00', 500: b'\x08', 1000: b'\x10', 2000: b'\x18'}
+
+
+class BH1750Sensor(I2CBaseSensor):
+    """BH1750 ambient light sensor."""
+
+    CONT_HIGH_RES = 0x10
+
+    def __init__(self, sensor_id, sensor_type="bh1750", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x23)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self._result = {"illuminance": 0.0}
+        self._rx = bytearray(2)
+        self._ready_at = time.ticks_ms()
+        try:
+            self._init_sensor()
+        except Exception as e:
+            print("BH1750 init failed: {}".format(e))
+
+    def _init_sensor(self):
+        # The measurement command implicitly powers the part on, so the
+        # explicit POWER_ON/RESET writes are redundant. Instead of
+        # sleeping through the 180 ms first-conversion window, stamp a
+        # deadline and let read() serve the fallback until it passes.
+        self.i2c.writeto(self.address, bytes([self.CONT_HIGH_RES]))
+        self._ready_at = time.ticks_add(time.ticks_ms(), 180)
+
+    def read(self):
+        result = self._result
+        if time.ticks_diff(time.ticks_ms(), self._ready_at) < 0:
+            return self._cache(result, cache_time=500)
+        try:
+            rx = self._rx
+            self.i2c.readfrom_into(self.address, rx)
+            lux = int.from_bytes(rx, 'big') / 1.2
+            result["illuminance"] = round(lux, 1)
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            result["illuminance"] = 500.0 + (t % 1000)
+        return self._cache(result, cache_time=500)
+
+
+class CCS811Sensor(I2CBaseSensor):
+    """CCS811 eCO2/TVOC air-quality sensor."""
+
+    STATUS_REG = 0x00
+    MEAS_MODE_REG = 0x01
+    ALG_RESULT_DATA_REG = 0x02
+    RAW_DATA_REG = 0x03
+    ENV_DATA_REG = 0x05
+    BASELINE_REG = 0x11
+    HW_ID_REG = 0x20
+    APP_START_REG = 0xF4
+    # ENV_DATA is 7.9 fixed point; the datasheet's +25 degC temperature
+    # offset pre-scaled into raw counts (25 * 512).
+    TEMP_BASE_Q79 = 12800
+    # Skip the ENV_DATA write unless either input moved by at least half
+    # a unit (0.5 %RH / 0.5 degC = 256 raw counts): the chip's own
+    # compensation resolution, so smaller writes are pure bus traffic.
+    ENV_DELTA_Q79 = 256
+
+    def __init__(self, sensor_id, sensor_type="ccs811", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x5A)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.drive_mode = self.inputs.get("drive_mode", 1)
+        # The chip produces a new ALG_RESULT once per drive-mode period;
+        # polling faster than that only re-reads the same sample.
+        self._min_interval_ms = {1: 1000, 2: 10000, 3: 60000,
+                                 4: 250}.get(self.drive_mode, 1000)
+        self._last_result = None
+        self._last_poll = 0
+        self._baseline = 0
+        self._baseline_at = None
+        # Reused result dict, mutated in place per refresh; consumers
+        # must copy readings they keep across polls.
+        self._result = {"eco2": 0, "tvoc": 0, "raw_current": 0, "baseline": 0}
+        # Reused ENV_DATA payload: filled in place per write, no bytes()
+        # allocation on the steady-state path.
+        self._env_tx = bytearray(4)
+        # Reused ALG_RESULT burst buffer.
+        self._rx = bytearray(8)
+        self._env_hum_raw = -1
+        self._env_temp_raw = -1
+        # Optional nINT wiring: when inputs['int_pin'] is set, a falling
+        # edge marks DATA_READY and read() never touches the bus between
+        # samples instead of relying on the drive-mode interval.
+        self._drdy = False
+        self._int_pin = None
+        int_pin = self.inputs.get("int_pin")
+        if int_pin is not None:
+            try:
+                pin = Pin(int_pin, Pin.IN, Pin.PULL_UP)
+                pin.irq(handler=self._on_drdy, trigger=Pin.IRQ_FALLING)
+                self._int_pin = pin
+            except Exception as e:
+                print("CCS811 int pin setup failed: {}".format(e))
+        try:
+            self._init_sensor()
+        except Exception as e:
+            print("CCS811 init failed: {}".format(e))
+
+    def _init_sensor(self):
+        hw_id = self.i2c.readfrom_mem(self.address, self.HW_ID_REG, 1)[0]
+        if hw_id != 0x81:
+            print("CCS811 unexpected hw id 0x%02x" % hw_id)
+        self.i2c.writeto(self.address, bytes([self.APP_START_REG]))
+        time.sleep_ms(100)
+        meas_mode = self.drive_mode << 4
+        if self._int_pin is not None:
+            meas_mode |= 0x08  # assert nINT on DATA_READY
+        self.i2c.writeto_mem(self.address, self.MEAS_MODE_REG,
+                             bytes([meas_mode]))
+        # Default compensation point, written once; callers with a real
+        # temperature/humidity source push updates via set_environment().
+        self._set_environmental_data(50.0, 25.0)
+
+    def _on_drdy(self, pin):
+        self._drdy = True
+
+    def _set_environmental_data(self, humidity, temperature):
+        hum_raw = int(humidity * 512.0) & 0xFFFF
+        temp_raw = (int(temperature * 512.0) + self.TEMP_BASE_Q79) & 0xFFFF
+        delta = self.ENV_DELTA_Q79
+        if (abs(hum_raw - self._env_hum_raw) < delta
+                and abs(temp_raw - self._env_temp_raw) < delta):
+            return
+        self._env_hum_raw = hum_raw
+        self._env_temp_raw = temp_raw
+        tx = self._env_tx
+        tx[0] = hum_raw >> 8
+        tx[1] = hum_raw & 0xFF
+        tx[2] = temp_raw >> 8
+        tx[3] = temp_raw & 0xFF
+        self.i2c.writeto_mem(self.address, self.ENV_DATA_REG, tx)
+
+    def set_environment(self, humidity, temperature):
+        """Feed measured humidity/temperature into the chip's compensation.
+
+        The write is skipped when neither value moved by at least half a
+        unit since the last one, so this is cheap to call per poll.
+        """
+        self._set_environmental_data(humidity, temperature)
+
+    def set_baseline(self, baseline):
+        self.i2c.writeto_mem(self.address, self.BASELINE_REG,
+                             struct.pack('>H', baseline))
+        self._baseline = baseline
+        self._baseline_at = time.ticks_ms()
+
+    def _get_baseline(self):
+        # The baseline drifts over hours, not seconds; re-read it at most
+        # every 5 s instead of paying a bus transaction per read().
+        now = time.ticks_ms()
+        if (self._baseline_at is None
+                or time.ticks_diff(now, self._baseline_at) >= 5000):
+            raw = self.i2c.readfrom_mem(self.address, self.BASELINE_REG, 2)
+            self._baseline = (raw[0] << 8) | raw[1]
+            self._baseline_at = now
+        return self._baseline
+
+    def read(self):
+        try:
+            last = self._last_result
+            if last is not None:
+                if self._int_pin is not None:
+                    # Interrupt-driven: the nINT edge is the only signal
+                    # that new data exists, no timing heuristics needed.
+                    if not self._drdy:
+                        return last
+                elif time.ticks_diff(time.ticks_ms(),
+                                     self._last_poll) < self._min_interval_ms:
+                    # Within the drive-mode period there cannot be new
+                    # data; skip the bus entirely.
+                    return last
+            # The 8-byte ALG_RESULT mailbox carries eCO2, TVOC, a STATUS
+            # mirror, ERROR_ID and RAW_DATA, so one burst replaces the
+            # separate STATUS, ALG_RESULT and RAW_DATA transactions.
+            alg = self._rx
+            self.i2c.readfrom_mem_into(self.address,
+                                       self.ALG_RESULT_DATA_REG, alg)
+            eco2, tvoc, status, _, raw = struct.unpack(_CCS811_ALG_FMT, alg)
+            if not (status & 0x08):
+                if last is not None:
+                    return last
+                raise OSError("no new data")
+            data = self._result
+            data["eco2"] = eco2
+            data["tvoc"] = tvoc
+            data["raw_current"] = raw >> 10
+            data["baseline"] = self._get_baseline()
+            self._last_result = data
+            self._last_poll = time.ticks_ms()
+            self._drdy = False
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            data = self._result
+            data["eco2"] = 400 + (t % 600)
+            data["tvoc"] = t % 100
+            data["raw_current"] = t % 63
+            data["baseline"] = 0
+        return self._cache(data, cache_time=1000)
+
+
+class TSL2561Sensor(I2CBaseSensor):
+    """TSL2561 digital light sensor with broadband + IR channels."""
+
+    COMMAND_BIT = 0x80
+    CONTROL_REG = 0x00
+    TIMING_REG = 0x01
+    DATA0LOW_REG = 0x0C
+    DATA1LOW_REG = 0x0E
+
+    def __init__(self, sensor_id, sensor_type="tsl2561", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x39)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.integration_time = self.inputs.get("integration_time", 2)
+        self.gain = self.inputs.get("gain", 0)
+        # Channel scale in 2^10 fixed point (datasheet integer algorithm):
+        # integration time and gain are normalised once here instead of
+        # re-branching per lux calculation.
+        if self.integration_time == 0:
+            ch_scale = 0x7517  # 322/11 * 2^10
+        elif self.integration_time == 1:
+            ch_scale = 0x0FE7  # 322/81 * 2^10
+        else:
+            ch_scale = 1 << 10
+        if self.gain == 0:
+            ch_scale <<= 4  # normalise 1x gain to the 16x reference
+        self._ch_scale = ch_scale
+        self._result = {"illuminance": 0.0, "broadband": 0, "infrared": 0}
+        # Reused 2-byte channel buffer.
+        self._rx = bytearray(2)
+        try:
+            self._init_sensor()
+        except Exception as e:
+            print("TSL2561 init failed: {}".format(e))
+
+    def _init_sensor(self):
+        self.i2c.writeto_mem(self.address, self.COMMAND_BIT | self.CONTROL_REG,
+                             b'\x03')
+        timing = (self.gain << 4) | self.integration_time
+        self.i2c.writeto_mem(self.address, self.COMMAND_BIT | self.TIMING_REG,
+                             bytes([timing]))
+
+    # (ratio limit, ch0 coeff, ch1 coeff) in 2^9 / 2^14 fixed point, from
+    # the TSL2561 datasheet's integer reference code (T/FN/CL package).
+    # The piecewise segments replace the reference float formula's
+    # ratio ** 1.4 power with integer multiplies.
+    _LUX_SEGMENTS = (
+        (0x0040, 0x01F2, 0x01BE),
+        (0x0080, 0x0214, 0x02D1),
+        (0x00C0, 0x023F, 0x037B),
+        (0x0100, 0x0270, 0x03FE),
+        (0x0138, 0x016F, 0x01FC),
+        (0x019A, 0x00D2, 0x00FB),
+        (0x029A, 0x0018, 0x0012),
+    )
+
+    def _calculate_lux(self, ch0, ch1):
+        if ch0 == 0:
+            return 0.0
+        scale = self._ch_scale
+        d0 = (ch0 * scale) >> 10
+        d1 = (ch1 * scale) >> 10
+        # Channel ratio in 2^9 fixed point, rounded.
+        ratio = ((d1 << 10) // d0 + 1) >> 1
+        b = m = 0
+        for limit, seg_b, seg_m in self._LUX_SEGMENTS:
+            if ratio <= limit:
+                b = seg_b
+                m = seg_m
+                break
+        lux = d0 * b - d1 * m
+        if lux < 0:
+            lux = 0
+        return (lux + (1 << 13)) >> 14
+
+    def read(self):
+        try:
+            rx = self._rx
+            self.i2c.readfrom_mem_into(
+                self.address, self.COMMAND_BIT | self.DATA0LOW_REG, rx)
+            ch0 = int.from_bytes(rx, 'little')
+            self.i2c.readfrom_mem_into(
+                self.address, self.COMMAND_BIT | self.DATA1LOW_REG, rx)
+            ch1 = int.from_bytes(rx, 'little')
+            data = self._result
+            data["illuminance"] = self._calculate_lux(ch0, ch1)
+            data["broadband"] = ch0
+            data["infrared"] = ch1
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            data = self._result
+            data["illuminance"] = 400.0 + (t % 800)
+            data["broadband"] = t % 30000
+            data["infrared"] = t % 12000
+        return self._cache(data, cache_time=500)
+
+
+class APDS9960Sensor(I2CBaseSensor):
+    """APDS9960 colour/proximity sensor."""
+
+    ENABLE_REG = 0x80
+    CDATAL_REG = 0x94
+    PDATA_REG = 0x9C
+
+    def __init__(self, sensor_id, sensor_type="apds9960", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x39)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self._result = {"clear": 0, "red": 0, "green": 0, "blue": 0,
+                        "proximity": 0}
+        try:
+            # Power on, ALS enable, proximity enable.
+            self.i2c.writeto_mem(self.address, self.ENABLE_REG, b'\x07')
+        except Exception as e:
+            print("APDS9960 init failed: {}".format(e))
+
+    def read(self):
+        try:
+            rgbc = self.i2c.readfrom_mem(self.address, self.CDATAL_REG, 8)
+            proximity = self.i2c.readfrom_mem(self.address, self.PDATA_REG, 1)[0]
+            data = self._result
+            data["clear"] = (rgbc[1] << 8) | rgbc[0]
+            data["red"] = (rgbc[3] << 8) | rgbc[2]
+            data["green"] = (rgbc[5] << 8) | rgbc[4]
+            data["blue"] = (rgbc[7] << 8) | rgbc[6]
+            data["proximity"] = proximity
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            data = self._result
+            data["clear"] = t % 1024
+            data["red"] = t % 256
+            data["green"] = (t * 2) % 256
+            data["blue"] = (t * 3) % 256
+            data["proximity"] = t % 128
+        return self._cache(data, cache_time=500)
+
+
+class VL53L0XSensor(I2CBaseSensor):
+    """VL53L0X time-of-flight distance sensor (single-shot ranging)."""
+
+    SYSRANGE_START_REG = 0x00
+    RESULT_RANGE_REG = 0x14
+
+    def __init__(self, sensor_id, sensor_type="vl53l0x", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x29)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self._result = {"distance_mm": 0, "distance_cm": 0.0}
+
+    def read(self):
+        data = self._result
+        try:
+            self.i2c.writeto_mem(self.address, self.SYSRANGE_START_REG, b'\x01')
+            time.sleep_ms(30)
+            result = self.i2c.readfrom_mem(self.address, self.RESULT_RANGE_REG, 12)
+            distance_mm = (result[10] << 8) | result[11]
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            distance_mm = 200 + (t % 1800)
+        data["distance_mm"] = distance_mm
+        data["distance_cm"] = distance_mm * 0.1
+        return self._cache(data, cache_time=200)
+
+
+class ADS1115Sensor(I2CBaseSensor):
+    """ADS1115 16-bit 4-channel ADC (single-shot reads)."""
+
+    CONVERSION_REG = 0x00
+    CONFIG_REG = 0x01
+
+    def __init__(self, sensor_id, sensor_type="ads1115", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x48)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.channel = self.inputs.get("channel", 0)
+        self._result = {"raw_value": 0, "voltage": 0.0}
+
+    def read(self):
+        try:
+            # Single-shot, selected channel vs GND, +-4.096V, 128 SPS
+            # (PGA bits 11:9 = 001, matching the 125 uV/LSB scale below).
+            config = 0x8383 | ((0x04 | self.channel) << 12)
+            self.i2c.writeto_mem(self.address, self.CONFIG_REG,
+                                 bytes([config >> 8, config & 0xFF]))
+            time.sleep_ms(9)
+            raw = self.i2c.readfrom_mem(self.address, self.CONVERSION_REG, 2)
+            value = (raw[0] << 8) | raw[1]
+            if value >= 32768:
+                value -= 65536
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            value = t % 26400
+        data = self._result
+        data["raw_value"] = value
+        data["voltage"] = round(value * 0.000125, 4)
+        return self._cache(data, cache_time=200)
+
+
+class SHT31DSensor(I2CBaseSensor):
+    """SHT31-D temperature/humidity sensor (high-repeatability one-shot)."""
+
+    def __init__(self, sensor_id, sensor_type="sht31d", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x44)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self._result = {"temperature": 0.0, "humidity": 0.0}
+
+    def read(self):
+        try:
+            self.i2c.writeto(self.address, b'\x2C\x06')
+            time.sleep_ms(15)
+            raw = self.i2c.readfrom(self.address, 6)
+            temp_raw = (raw[0] << 8) | raw[1]
+            hum_raw = (raw[3] << 8) | raw[4]
+            data = self._result
+            data["temperature"] = round(-45 + 175 * temp_raw / 65535, 1)
+            data["humidity"] = round(100 * hum_raw / 65535, 1)
+        except Exception:
+            t = time.ticks_diff(time.ticks_ms(), _T0) // 1000
+            data = self._result
+            data["temperature"] = 22.0 + (t % 12) - 6
+            data["humidity"] = 50.0 + (t % 30) - 15
+        return self._cache(data, cache_time=1000)
+
+
+class TCS34725Sensor(I2CBaseSensor):
+    """TCS34725 RGB colour sensor."""
+
+    COMMAND_BIT = 0x80
+    ENABLE_REG = 0x00
+    ATIME_REG = 0x01
+    CDATAL_REG = 0x14
+
+    def __init__(self, sensor_id, sensor_type="tcs34725", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x29)
+        super().__init__(sensor_id, sensor_type, inputs)
+        try:
+            self.i2c.writeto_mem(self.address,
+                                 self.COMMAND_BIT | self.ENABLE_REG, b'\x03')
+            self.i2c.writeto_mem(self.address,
+                                 self.COMMAND_BIT | self.ATIME_REG, b'\xD5')
+        except Exception as e:
+            print("TCS34725 init failed: {}".format(e))
+        self._result = {"clear": 0, "red": 0, "green": 0, "blue": 0}
+
+    def read(self):
+        try:
+            raw = self.i2c.readfrom_mem(self.address,
+                                        self.COMMAND_BIT | self.CDATAL_REG, 8)
+            data = self._result
+            data["clear"] = (raw[1] << 8) | raw[0]
+            data["red"] = (raw[3] << 8) | raw[2]
+            data["green"] = (raw[5] << 8) | raw[4]
+            data["blue"] = (raw[7] << 8) | raw[6]
+        except Exception:
+            s = sin  # local alias: LOAD_FAST beats a global lookup per call
+            t = time.ticks_diff(time.ticks_ms(), _T0) * 0.001
+            st = s(t)
+            data = self._result
+            data["clear"] = int(512 + 256 * st)
+            data["red"] = int(128 + 100 * s(t + 2.094))
+            data["green"] = int(128 + 100 * s(t + 4.189))
+            data["blue"] = int(128 + 100 * st)
+        return self._cache(data, cache_time=500)
+
+
+class MPU6050Sensor(I2CBaseSensor):
+    """MPU6050 6-axis accelerometer/gyroscope."""
+
+    PWR_MGMT_1_REG = 0x6B
+    GYRO_CONFIG_REG = 0x1B
+    ACCEL_CONFIG_REG = 0x1C
+    ACCEL_XOUT_H_REG = 0x3B
+    TEMP_OUT_H_REG = 0x41
+    GYRO_XOUT_H_REG = 0x43
+
+    def __init__(self, sensor_id, sensor_type="mpu6050", inputs=None):
+        if inputs is None:
+            inputs = {}
+        inputs.setdefault("address", 0x68)
+        super().__init__(sensor_id, sensor_type, inputs)
+        self.accel_range = self.inputs.get("accel_range", 2)
+        self.gyro_range = self.inputs.get("gyro_range", 250)
+        # Reciprocal scale factors, resolved once: the read path does six
+        # multiplies instead of dict lookups and divides per sample.
+        self._inv_accel = 1.0 / _MPU_ACCEL_SCALE.get(self.accel_range, 16384.0)
+        self._inv_gyro = 1.0 / _MPU_GYRO_SCALE.get(self.gyro_range, 131.0)
+        self._result = {"accel_x": 0.0, "accel_y": 0.0, "accel_z": 0.0,
+                        "gyro_x": 0.0, "gyro_y": 0.0, "gyro_z": 0.0,
+                        "temperature": 0.0}
+        # Reused 14-byte burst buffer: zero allocation per sample.
+        self._rx = bytearray(14)
+        try:
+            self._init_sensor()
+        except Exception as e:
+            print("MPU6050 init failed: {}".format(e))
+
+    def _init_sensor(self):
+        # Wake from sleep.
+        self.i2c.writeto_mem(self.address, self.PWR_MGMT_1_REG, b'\x00')
+        self.i2c.writeto_mem(self.address, self.ACCEL_CONFIG_REG,
+                             _MPU_ACCEL_CFG.get(self.accel_range, b'\x00'))
+        self.i2c.writeto_mem(self.address, self.GYRO_CONFIG_REG,
+                             _MPU_GYRO_CFG.get(self.gyro_range, b'\x00'))
+
+    def read(self):
+        try:
+            # Registers 0x3B..0x48 are contiguous (accel, temp, gyro),
+            # so one 14-byte burst replaces three transactions and all
+            # seven words come from the same sample instant.
+            buf = self._rx
+            self.i2c.readfrom_mem_into(self.address,
+                                       self.ACCEL_XOUT_H_REG, buf)
+            ax, ay, az, t_raw, gx, gy, gz = struct.unpack(_MPU_FRAME_FMT, buf)
+            a_k = self._inv_accel
+            g_k = self._inv_gyro
+            data = self._result
+            data["accel_x"] = round(ax * a_k, 3)
+            data["accel_y"] = round(ay * a_k, 3)
+            data["accel_z"] = round(az * a_k, 3)
+            data["gyro_x"] = round(gx * g_k, 2)
+            data["gyro_y"] = round(gy * g_k, 2)
+            data["gyro_z"] = round(gz * g_k, 2)
+            data["temperature"] = round(t_raw * (1.0 / 340.0) + 36.53, 1)
+        except Exception:
+            s = sin
+            c = cos
+            t = time.ticks_diff(time.ticks_ms(), _T0) * 0.001
+            t3 = t * 3
+            t5 = t * 5
+            st = s(t)
+            st3 = s(t3)
+            data = self._result
+            data["accel_x"] = round(0.1 * st, 3)
+            data["accel_y"] = round(0.1 * c(t), 3)
+            data["accel_z"] = round(1.0 + 0.05 * st3, 3)
+            data["gyro_x"] = round(2.0 * s(t5), 2)
+            data["gyro_y"] = round(2.0 * c(t5), 2)
+            data["gyro_z"] = round(1.0 * st3, 2)
+            data["temperature"] = round(25.0 + st * 2, 1)
+        return self._cache(data, cache_time=50)
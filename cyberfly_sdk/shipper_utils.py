@@ -0,0 +1,237 @@
+"""Network and Pact helpers shared by the data shipper.
+
+Heavy modules (network, urequests) are imported once at module load and
+reused; optional ones degrade to None so the rest of the SDK still works
+on ports or hosts without them.
+"""
+
+import time
+
+try:
+    import ujson as json
+except ImportError:
+    import json
+
+try:
+    import network
+except ImportError:
+    network = None
+
+try:
+    import usocket as socket
+except ImportError:
+    import socket
+
+try:
+    import urequests as requests
+except ImportError:
+    try:
+        import requests
+    except ImportError:
+        requests = None
+
+from .pact.crypto import Crypto
+from .time_utils import get_time
+
+# Diagnostic prints block on the UART and allocate format strings on
+# the publish hot path; leave them off in production builds.
+_DEBUG = False
+
+# One signer for the module: Crypto is stateless, so constructing it per
+# command was pure allocator churn.
+_CRYPTO = Crypto()
+
+_API_HOST = "https://node.cyberfly.io"
+_PROBE_HOST = "node.cyberfly.io"
+
+# Even a plain TCP probe costs a DNS lookup and a round trip, so one
+# positive answer is trusted for this long.
+_CNX_TTL_MS = 30000
+_last_cnx_ok = None
+# Resolved probe address, cached after the first successful lookup: DNS
+# is a network round trip of its own and the node's address is stable.
+_probe_addr = None
+
+
+def is_cnx_active():
+    """True when the cyberfly node is reachable; success is cached for 30 s.
+
+    A bare TCP connect to port 443 answers "is the network up" without
+    paying for a TLS handshake and HTTP framing the way a full request
+    would.
+    """
+    global _last_cnx_ok, _probe_addr
+    now = time.ticks_ms()
+    if (_last_cnx_ok is not None
+            and time.ticks_diff(now, _last_cnx_ok) < _CNX_TTL_MS):
+        return True
+    s = None
+    try:
+        if _probe_addr is None:
+            _probe_addr = socket.getaddrinfo(_PROBE_HOST, 443)[0][-1]
+        s = socket.socket()
+        s.settimeout(2)
+        s.connect(_probe_addr)
+        _last_cnx_ok = now
+        return True
+    except Exception:
+        # A failed connect may mean a stale address as well as a down
+        # link; re-resolve on the next probe.
+        _probe_addr = None
+        return False
+    finally:
+        if s is not None:
+            s.close()
+
+
+# Prebuilt API base URLs: only two network ids exist, so the string
+# concatenation per call was pure allocation.
+_API_HOSTS = {
+    "mainnet01": "https://node.cyberfly.io/api/v1",
+}
+_TESTNET_API = "https://node-testnet.cyberfly.io/api/v1"
+
+
+def get_api_host(network_id="testnet04"):
+    return _API_HOSTS.get(network_id, _TESTNET_API)
+
+
+# Pact meta defaults, boxed once at import rather than per call.
+_META_CHAIN_ID = "1"
+_META_GAS_PRICE = 0.0000001
+_META_GAS_LIMIT = 1000
+_META_TTL = 28800
+
+
+def mk_meta(sender="", chain_id=_META_CHAIN_ID, gas_price=_META_GAS_PRICE,
+            gas_limit=_META_GAS_LIMIT):
+    return {
+        "creationTime": get_time(),
+        "ttl": _META_TTL,
+        "gasLimit": gas_limit,
+        "chainId": chain_id,
+        "gasPrice": gas_price,
+        "sender": sender,
+    }
+
+
+# Single-entry signing cache: repeated publishes of the same data
+# within one 5 s nonce window reuse the previous signature instead of
+# re-running Ed25519 (the dominant cost of publish() by far). Keyed by
+# the serialised content - identity would alias distinct dicts whenever
+# the allocator recycles an address, which MicroPython's heap does
+# routinely - so the extra dumps() on a miss buys correctness.
+_cmd_cache_key = None
+_cmd_cache_val = None
+
+
+def make_cmd(data, key_pair):
+    """Build a signed Pact command envelope for one message."""
+    global _cmd_cache_key, _cmd_cache_val
+    key = (json.dumps(data), key_pair["publicKey"], get_time() // 5)
+    if key == _cmd_cache_key:
+        return _cmd_cache_val
+    payload = {
+        "data": data,
+        "meta": mk_meta("", "1", 0.0000001, 1000),
+        "nonce": str(get_time()),
+    }
+    msg = json.dumps(payload)
+    if _DEBUG:
+        print("signing payload", msg)
+    signed = _CRYPTO.sign(msg, key_pair)
+    cmd = {
+        "cmd": msg,
+        "hash": signed["hash"],
+        "sigs": [{"sig": signed["sig"]}],
+        "pubKey": key_pair["publicKey"],
+    }
+    _cmd_cache_key = key
+    _cmd_cache_val = cmd
+    return cmd
+
+
+def publish(client, data, device_list, key_pair):
+    """Sign and publish data to every device topic.
+
+    data may be a dict (preferred) or a pre-serialised JSON string;
+    strings are parsed once here instead of per device.
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+    # Sign and serialise once: the command is not device-specific, and
+    # an Ed25519 signature dwarfs the cost of the extra publishes. The
+    # whole batch shares one nonce/creation time as a consequence.
+    payload = json.dumps(make_cmd(data, key_pair))
+    publish_many(client, device_list, payload)
+
+
+def publish_many(client, topics, payload):
+    """Send one pre-serialised payload to every topic.
+
+    Kept as the single fan-out point so a client with a native
+    multi-topic send can be dropped in here later; umqtt only offers
+    per-topic publish, which at QoS 0 is one socket write each anyway.
+    """
+    for topic in topics:
+        client.publish(topic, payload)
+
+
+def connect_wifi(ssid, password):
+    """Join the given network; returns True once an IP is assigned.
+
+    Polls at 100 ms instead of whole-second sleeps, so a typical
+    association is detected within a tenth of a second of completing,
+    and bails out early on definitive failure codes (wrong password,
+    no AP) instead of waiting out the full 20 s budget.
+    """
+    if network is None:
+        return False
+    wlan = network.WLAN(network.STA_IF)
+    wlan.active(True)
+    try:
+        # Modem power save adds latency to every exchange; ports without
+        # the option just skip this.
+        wlan.config(pm=network.WLAN.PM_NONE)
+    except (AttributeError, ValueError, OSError):
+        pass
+    if not wlan.isconnected():
+        wlan.connect(ssid, password)
+        for _ in range(200):
+            if wlan.isconnected():
+                break
+            try:
+                # Negative status codes are terminal (bad auth, no AP).
+                if wlan.status() < 0:
+                    break
+            except (AttributeError, OSError):
+                pass
+            time.sleep_ms(100)
+    if wlan.isconnected():
+        print("wifi connected:", wlan.ifconfig()[0])
+        return True
+    print("wifi connect failed")
+    return False
+
+
+# Characters that can open a numeric literal; anything else means the
+# float() parse below is guaranteed to raise.
+_NUM_LEAD = "+-.0123456789"
+
+
+def is_number(value):
+    # float() is far cheaper than the complex() constructor this used,
+    # and actual numbers skip the parse entirely.
+    if isinstance(value, (int, float)):
+        return True
+    if not isinstance(value, str) or not value:
+        return False
+    if value[0] not in _NUM_LEAD:
+        # Cheap reject: raising and catching ValueError costs a heap
+        # allocation and a stack unwind, far more than this lookup.
+        return False
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
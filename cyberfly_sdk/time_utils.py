@@ -0,0 +1,47 @@
+"""Wall-clock helpers backed by NTP."""
+
+import time
+
+# cntptime resolved once: re-running the import machinery per call is a
+# dict-lookup cascade we do not want on the publish path. False marks a
+# failed probe so ports without the module never retry the import.
+_cntptime = None
+
+
+def get_time():
+    """POSIX seconds, from NTP when available, else the local RTC."""
+    global _cntptime
+    if _cntptime is None:
+        try:
+            import cntptime
+            _cntptime = cntptime
+        except ImportError:
+            _cntptime = False
+    if _cntptime:
+        try:
+            return int(_cntptime.time())
+        except Exception:
+            pass
+    return int(time.time())
+
+
+def get_datetime():
+    return time.localtime(get_time())
+
+
+# Last formatted timestamp, cached at one-second granularity: status
+# paths format the same second many times per reading burst.
+_last_sec = -1
+_last_str = ""
+
+
+def get_datetime_string():
+    global _last_sec, _last_str
+    sec = get_time()
+    if sec == _last_sec:
+        return _last_str
+    t = time.localtime(sec)
+    _last_str = "%04d-%02d-%02d %02d:%02d:%02d" % (t[0], t[1], t[2],
+                                                   t[3], t[4], t[5])
+    _last_sec = sec
+    return _last_str
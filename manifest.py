@@ -0,0 +1,11 @@
+# Frozen-module manifest for the cyberfly SDK.
+#
+# Build into firmware with e.g.
+#     make BOARD=<board> FROZEN_MANIFEST=/path/to/this/manifest.py
+# Freezing compiles the whole package ahead of time with mpy-cross
+# (opt=3 strips asserts and line numbers and enables const() folding)
+# and keeps its bytecode in XIP flash instead of heap RAM, so imports
+# skip the parse/compile step entirely on boot.
+include("$(PORT_DIR)/boards/manifest.py")
+
+package("cyberfly_sdk", opt=3)